@@ -13,6 +13,9 @@ Think of this as a "translator" between Python code and MySQL database.
 # Import hashlib - used for hashing passwords (creating default admin user)
 import hashlib
 
+# Import threading - used to stop two threads from using the connection at once
+import threading
+
 # Try to import MySQL connector library
 # This is a try/except block - if the library isn't installed, we catch the error
 try:
@@ -54,6 +57,13 @@ class DatabaseManager:
         # We'll create the connection when needed (lazy connection)
         self.connection = None
         
+        # Lock that protects the connection
+        # Some work (like report exports) runs on a background thread, and a
+        # MySQL connection must only be used by one thread at a time.
+        # RLock (re-entrant lock) lets the same thread take it more than once,
+        # e.g. execute_query() holding the lock and then calling connect()
+        self._lock = threading.RLock()
+        
         # If no config provided, use empty dictionary
         # This prevents errors if mysql_config is None
         if mysql_config is None:
@@ -99,31 +109,32 @@ class DatabaseManager:
             ImportError: If MySQL connector library is not installed
             ConnectionError: If connection to database fails
         """
-        # Only create new connection if one doesn't exist
-        # This prevents creating multiple connections unnecessarily
-        if self.connection is None:
-            # Double-check MySQL connector is available
-            if not MYSQL_AVAILABLE:
-                raise ImportError("mysql-connector-python is required for MySQL support")
+        with self._lock:
+            # Only create new connection if one doesn't exist
+            # This prevents creating multiple connections unnecessarily
+            if self.connection is None:
+                # Double-check MySQL connector is available
+                if not MYSQL_AVAILABLE:
+                    raise ImportError("mysql-connector-python is required for MySQL support")
+                
+                # Try to connect to database
+                try:
+                    # mysql.connector.connect() creates a connection to MySQL database
+                    # We pass all the connection parameters from our config
+                    self.connection = mysql.connector.connect(
+                        host=self.mysql_config['host'],      # Database server address
+                        port=self.mysql_config['port'],      # Database server port
+                        user=self.mysql_config['user'],      # Username
+                        password=self.mysql_config['password'],  # Password
+                        database=self.mysql_config['database']    # Database name
+                    )
+                except Error as e:
+                    # If connection fails, raise a more user-friendly error
+                    # str(e) converts the MySQL error to a readable string
+                    raise ConnectionError(f"Failed to connect to MySQL: {str(e)}")
             
-            # Try to connect to database
-            try:
-                # mysql.connector.connect() creates a connection to MySQL database
-                # We pass all the connection parameters from our config
-                self.connection = mysql.connector.connect(
-                    host=self.mysql_config['host'],      # Database server address
-                    port=self.mysql_config['port'],      # Database server port
-                    user=self.mysql_config['user'],      # Username
-                    password=self.mysql_config['password'],  # Password
-                    database=self.mysql_config['database']    # Database name
-                )
-            except Error as e:
-                # If connection fails, raise a more user-friendly error
-                # str(e) converts the MySQL error to a readable string
-                raise ConnectionError(f"Failed to connect to MySQL: {str(e)}")
-        
-        # Return the connection (either newly created or existing)
-        return self.connection
+            # Return the connection (either newly created or existing)
+            return self.connection
     
     def close(self):
         """
@@ -132,13 +143,14 @@ class DatabaseManager:
         This should be called when the application exits to free up resources.
         It's good practice to always close database connections when done.
         """
-        # Check if connection exists before trying to close it
-        if self.connection:
-            # Close the connection - releases resources and disconnects from database
-            self.connection.close()
-            
-            # Set to None so we know connection is closed
-            self.connection = None
+        with self._lock:
+            # Check if connection exists before trying to close it
+            if self.connection:
+                # Close the connection - releases resources and disconnects from database
+                self.connection.close()
+                
+                # Set to None so we know connection is closed
+                self.connection = None
     
     def initialize_database(self):
         """
@@ -347,28 +359,31 @@ class DatabaseManager:
             results = db.execute_query("SELECT * FROM employees WHERE id = %s", (1,))
             # Returns: [{'id': 1, 'first_name': 'John', 'last_name': 'Doe', ...}]
         """
-        # Get database connection
-        conn = self.connect()
-        
-        # Create cursor with dictionary=True
-        # This makes results return as dictionaries instead of tuples
-        cursor = conn.cursor(dictionary=True)
-        
-        try:
-            # Execute the SQL query
-            # params tuple fills in the %s placeholders safely
-            cursor.execute(query, params)
+        # Hold the lock for the whole query so another thread can't use
+        # the connection at the same time
+        with self._lock:
+            # Get database connection
+            conn = self.connect()
             
-            # Fetch all results from the query
-            # fetchall() gets all rows returned by the query
-            rows = cursor.fetchall()
+            # Create cursor with dictionary=True
+            # This makes results return as dictionaries instead of tuples
+            cursor = conn.cursor(dictionary=True)
             
-            # Convert to list and return
-            # list() ensures we return a proper list
-            return list(rows)
-        finally:
-            # Always close cursor to free resources
-            cursor.close()
+            try:
+                # Execute the SQL query
+                # params tuple fills in the %s placeholders safely
+                cursor.execute(query, params)
+                
+                # Fetch all results from the query
+                # fetchall() gets all rows returned by the query
+                rows = cursor.fetchall()
+                
+                # Convert to list and return
+                # list() ensures we return a proper list
+                return list(rows)
+            finally:
+                # Always close cursor to free resources
+                cursor.close()
     
     def execute_update(self, query, params=()):
         """
@@ -390,26 +405,27 @@ class DatabaseManager:
                 (50000, 1)
             )
         """
-        # Get database connection
-        conn = self.connect()
-        
-        # Create cursor (regular cursor, not dictionary mode)
-        cursor = conn.cursor()
-        
-        try:
-            # Execute the SQL query
-            cursor.execute(query, params)
+        with self._lock:
+            # Get database connection
+            conn = self.connect()
             
-            # Commit changes to database (make them permanent)
-            # Without commit(), changes would be lost when connection closes
-            conn.commit()
+            # Create cursor (regular cursor, not dictionary mode)
+            cursor = conn.cursor()
             
-            # Return number of rows affected
-            # rowcount tells us how many rows were inserted/updated/deleted
-            return cursor.rowcount
-        finally:
-            # Always close cursor
-            cursor.close()
+            try:
+                # Execute the SQL query
+                cursor.execute(query, params)
+                
+                # Commit changes to database (make them permanent)
+                # Without commit(), changes would be lost when connection closes
+                conn.commit()
+                
+                # Return number of rows affected
+                # rowcount tells us how many rows were inserted/updated/deleted
+                return cursor.rowcount
+            finally:
+                # Always close cursor
+                cursor.close()
     
     def get_last_insert_id(self):
         """
@@ -425,16 +441,17 @@ class DatabaseManager:
             db.execute_update("INSERT INTO employees (...) VALUES (...)")
             new_id = db.get_last_insert_id()  # Gets the new employee's ID
         """
-        # Get database connection
-        conn = self.connect()
-        
-        # Create cursor
-        cursor = conn.cursor()
-        
-        try:
-            # Return the ID of the last inserted row
-            # lastrowid is a property of the cursor that contains the last auto-generated ID
-            return cursor.lastrowid
-        finally:
-            # Always close cursor
-            cursor.close()
+        with self._lock:
+            # Get database connection
+            conn = self.connect()
+            
+            # Create cursor
+            cursor = conn.cursor()
+            
+            try:
+                # Return the ID of the last inserted row
+                # lastrowid is a property of the cursor that contains the last auto-generated ID
+                return cursor.lastrowid
+            finally:
+                # Always close cursor
+                cursor.close()
@@ -10,6 +10,9 @@ data from the database. The GUI code doesn't need to know SQL - it just calls
 these model methods.
 """
 
+# Import sys - sys.intern() lets equal strings share one string object
+import sys
+
 # Import DatabaseManager - we need this to execute database queries
 # The dot (.) means "from the same package" (database package)
 from .db_manager import DatabaseManager
@@ -206,6 +209,14 @@ class EmployeeModel:
     Think of this as an "employee manager" that knows how to work with employee data.
     """
     
+    # Columns selected for the reports (see get_all_for_report and iter_all)
+    # department_id needs no extra index for the JOIN: InnoDB already
+    # indexes a FOREIGN KEY column (see the employees table in db_manager.py)
+    _REPORT_COLUMNS = (
+        "e.id, e.first_name, e.last_name, e.email, e.position, e.salary, "
+        "d.name as department_name"
+    )
+    
     def __init__(self, db_manager):
         """
         Initialize the employee model.
@@ -261,12 +272,144 @@ class EmployeeModel:
         # d.name as department_name gets department name and calls it 'department_name'
         # LEFT JOIN means include employees even if they don't have a department
         # ORDER BY sorts employees by last name, then first name
-        return self.db.execute_query("""
+        rows = self.db.execute_query("""
             SELECT e.*, d.name as department_name 
             FROM employees e
             LEFT JOIN departments d ON e.department_id = d.id
             ORDER BY e.last_name, e.first_name
         """)
+        
+        # Let employees of the same department share one name string
+        return self._share_department_names(rows)
+    
+    @staticmethod
+    def _share_department_names(rows):
+        """
+        Make rows with the same department name use the same string object.
+        
+        The database driver creates a new string for every row, so 1000
+        employees in "Sales" means 1000 separate "Sales" strings. sys.intern()
+        replaces them with one shared string, which saves memory.
+        
+        Interned strings are also shared between fetches (and with the names
+        from count_by_department), so when the report checks if the data
+        changed (old rows == new rows), equal department names are the same
+        object and Python doesn't have to compare their characters.
+        
+        Args:
+            rows (list): Employee dictionaries (changed in place)
+            
+        Returns:
+            list: The same rows
+        """
+        for row in rows:
+            name = row['department_name']
+            # None = employee without a department (nothing to share)
+            if name is not None:
+                # sys.intern() returns the shared string with this text
+                row['department_name'] = sys.intern(name)
+        return rows
+    
+    def get_all_for_report(self, limit=None):
+        """
+        Get all employees with only the columns the reports show.
+        
+        Same rows and order as get_all(), but instead of e.* only the seven
+        listed columns are selected (no phone, hire_date, created_at, ...).
+        Each row is smaller, so the database sends less data and the driver
+        builds smaller dictionaries.
+        
+        Args:
+            limit (int, optional): Only return the first `limit` employees
+                                  (in name order). None returns all of them.
+        
+        Returns:
+            list: List of dictionaries with the keys id, first_name,
+                  last_name, email, position, salary and department_name
+        """
+        query = """
+            SELECT """ + self._REPORT_COLUMNS + """
+            FROM employees e
+            LEFT JOIN departments d ON e.department_id = d.id
+            ORDER BY e.last_name, e.first_name
+        """
+        if limit is None:
+            rows = self.db.execute_query(query)
+        else:
+            # LIMIT makes the database send only the first rows
+            rows = self.db.execute_query(query + " LIMIT %s", (limit,))
+        
+        # Let employees of the same department share one name string
+        return self._share_department_names(rows)
+    
+    def iter_all(self, chunk_size=1000):
+        """
+        Go through all employees (with department names) a chunk at a time.
+        
+        Unlike get_all_for_report(), this doesn't load every employee into
+        one list.
+        It is a generator: it fetches chunk_size rows, hands them out one by
+        one, then fetches the next chunk. At most one chunk is held in
+        memory, however many employees there are.
+        
+        The chunks are fetched with "keyset pagination": each query asks for
+        the rows that come after the last row of the previous chunk (by
+        last name, first name, id) instead of skipping rows with OFFSET.
+        So if an employee is added or deleted while the export is running,
+        the rows already handed out don't shift - no employee is skipped or
+        handed out twice. (Each chunk is a separate query, so an employee
+        added during the export is included only if it sorts after the
+        current position.) It is also cheaper: with OFFSET the database
+        had to sort and step over all the earlier rows again for every
+        chunk; the WHERE condition leaves them out before sorting.
+        
+        Args:
+            chunk_size (int): Number of rows fetched per query (default 1000)
+        
+        Yields:
+            dict: One employee (same fields as get_all_for_report())
+        
+        Example:
+            for emp in employee_model.iter_all():
+                print(emp['email'])
+        """
+        # Same query as get_all_for_report(), but e.id is added to ORDER BY
+        # so every row has a unique position in the order (two employees
+        # can have the same name, but not the same id)
+        select = """
+            SELECT """ + self._REPORT_COLUMNS + """
+            FROM employees e
+            LEFT JOIN departments d ON e.department_id = d.id
+        """
+        order = """
+            ORDER BY e.last_name, e.first_name, e.id
+            LIMIT %s
+        """
+        
+        # The first chunk starts at the beginning
+        rows = self.db.execute_query(select + order, (chunk_size,))
+        
+        # Later chunks start after the last row handed out
+        # (a, b, c) > (x, y, z) compares the columns in order, like sorting
+        # does: first by last name, then first name, then id
+        next_query = select + """
+            WHERE (e.last_name, e.first_name, e.id) > (%s, %s, %s)
+        """ + order
+        
+        while True:
+            # "yield from" hands out the rows of this chunk one by one
+            yield from rows
+            
+            # A short (or empty) chunk means there are no more rows
+            if len(rows) < chunk_size:
+                return
+            
+            # Continue after the last row of this chunk
+            last = rows[-1]
+            rows = self.db.execute_query(
+                next_query,
+                (last['last_name'], last['first_name'], last['id'], chunk_size)
+            )
     
     def get_by_id(self, emp_id):
         """
@@ -389,6 +532,37 @@ class EmployeeModel:
         # Return True if at least one row was deleted
         return rows_affected > 0
     
+    def count_by_department(self):
+        """
+        Count how many employees each department has.
+        
+        The counting is done by the database (GROUP BY), so only one row per
+        department is sent back instead of every employee.
+        
+        Returns:
+            list: List of (department_name, employee_count) tuples, sorted by
+                  department name. Employees without a department are counted
+                  under "No Department".
+                  Example: [('IT', 5), ('No Department', 1), ('Sales', 3)]
+        """
+        # COALESCE(d.name, 'No Department') uses 'No Department' when the
+        # employee has no department (LEFT JOIN gives NULL for d.name)
+        # COUNT(*) counts employees in each group
+        # GROUP BY makes one group (one result row) per department name
+        # ORDER BY sorts the rows by department name
+        rows = self.db.execute_query("""
+            SELECT COALESCE(d.name, 'No Department') as department_name,
+                   COUNT(*) as employee_count
+            FROM employees e
+            LEFT JOIN departments d ON e.department_id = d.id
+            GROUP BY department_name
+            ORDER BY department_name
+        """)
+        
+        # Convert result dictionaries to (name, count) tuples
+        # sys.intern() makes the names the same string objects as in the employee rows
+        return [(sys.intern(row['department_name']), row['employee_count']) for row in rows]
+    
     def get_statistics(self):
         """
         Get statistical information about all employees.
@@ -400,6 +574,17 @@ class EmployeeModel:
         - Maximum salary
         - Total salary budget
         
+        All five values are computed by the database in one query that
+        returns a single row, so no employee rows are sent to Python:
+        
+            SELECT COUNT(*) as total_employees, AVG(salary) as avg_salary,
+                   MIN(salary) as min_salary, MAX(salary) as max_salary,
+                   SUM(salary) as total_salary
+            FROM employees
+        
+        With no employees, COUNT(*) is 0 and the other four are NULL (None);
+        the reports only show the salary lines when total_employees > 0.
+        
         Returns:
             dict: Dictionary with statistics:
                   {
@@ -0,0 +1,132 @@
+"""
+Confirmation Dialog - Smart Records System
+
+This module creates a small Yes/No popup window used to confirm actions
+(for example logging out).
+
+Unlike messagebox.askyesno(), which opens a native dialog that stops
+Tkinter's event loop until it is closed, this dialog is a normal
+CustomTkinter window. While it waits for an answer, the main loop keeps
+running, so scheduled work (like finishing a background export) still happens.
+
+GUI CONCEPTS EXPLAINED:
+- CTkToplevel: Creates a popup window (separate from main window)
+- wait_variable(): Waits until a variable changes, while still processing events
+- withdraw()/deiconify(): Hide and show a window without destroying it
+- grab_set(): Makes the dialog modal (other windows ignore clicks)
+"""
+
+# Import CustomTkinter for modern GUI widgets
+import customtkinter as ctk
+
+# Import tkinter for IntVar (variable the dialog waits on)
+import tkinter as tk
+
+
+class ConfirmDialog(ctk.CTkToplevel):
+    """
+    Yes/No Confirmation Dialog Class
+    
+    The dialog is created once and reused: after the user answers it is
+    hidden with withdraw(), and ask() shows it again. This avoids rebuilding
+    its widgets every time a confirmation is needed.
+    
+    Example:
+        dialog = ConfirmDialog(root)
+        if dialog.ask("Logout", "Are you sure you want to logout?"):
+            ...
+    """
+    
+    def __init__(self, parent):
+        """
+        Initialize the confirmation dialog (hidden until ask() is called).
+        
+        Args:
+            parent: Window the dialog belongs to (usually the root window)
+        """
+        # Call parent class constructor
+        super().__init__(parent)
+        
+        # Hide the window until ask() is called
+        self.withdraw()
+        
+        # Store parent so the dialog can be centered on it
+        self.parent = parent
+        
+        # Prevent resizing
+        self.resizable(False, False)
+        
+        # Keep the dialog on top of the parent window
+        self.transient(parent)
+        
+        # Variable that holds the answer (1 = Yes, 0 = No)
+        # ask() waits until this variable is set
+        self._answer = tk.IntVar(master=self, value=0)
+        
+        # Closing the dialog with the X button counts as "No"
+        self.protocol("WM_DELETE_WINDOW", lambda: self._answer.set(0))
+        
+        # Create message label
+        # wraplength wraps long messages onto several lines
+        self._message_label = ctk.CTkLabel(self, text="", wraplength=300)
+        self._message_label.pack(padx=20, pady=(20, 10))
+        
+        # Create frame for buttons
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.pack(pady=(0, 20))
+        
+        # Create Yes and No buttons
+        # Each button sets the answer, which ends the wait in ask()
+        ctk.CTkButton(
+            button_frame,
+            text="Yes",
+            command=lambda: self._answer.set(1),
+            width=100
+        ).pack(side="left", padx=5)
+        
+        ctk.CTkButton(
+            button_frame,
+            text="No",
+            command=lambda: self._answer.set(0),
+            width=100
+        ).pack(side="left", padx=5)
+    
+    def ask(self, title, message):
+        """
+        Show the dialog and wait for the user to answer.
+        
+        The main loop keeps running while waiting, so other windows still
+        redraw and scheduled callbacks still run.
+        
+        Args:
+            title: Dialog window title
+            message: Question to show
+        
+        Returns:
+            bool: True if the user clicked Yes, False otherwise
+        """
+        # Set title and message for this question
+        self.title(title)
+        self._message_label.configure(text=message)
+        
+        # Show the dialog centered over the parent window
+        self.update_idletasks()
+        x = self.parent.winfo_rootx() + (self.parent.winfo_width() - self.winfo_reqwidth()) // 2
+        y = self.parent.winfo_rooty() + (self.parent.winfo_height() - self.winfo_reqheight()) // 2
+        self.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+        self.deiconify()
+        self.lift()
+        
+        # Make the dialog modal (blocks clicks on other windows)
+        self.grab_set()
+        self.focus()
+        
+        # Wait until a button is clicked (or the window is closed)
+        # wait_variable() returns when _answer is set, even to the same value
+        self.wait_variable(self._answer)
+        
+        # Release the modal grab and hide the dialog for next time
+        self.grab_release()
+        self.withdraw()
+        
+        return self._answer.get() == 1
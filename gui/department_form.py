@@ -34,6 +34,9 @@ from tkinter import ttk, messagebox
 # validate_required checks if a field is not empty
 from utils.validators import validate_required
 
+# Import get_font - returns shared fonts (created once, then reused)
+from gui.fonts import get_font
+
 
 class DepartmentForm(ctk.CTkScrollableFrame):
     """
@@ -50,7 +53,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
     - "delete": Show interface to delete department
     """
     
-    def __init__(self, parent, department_model, mode="view"):
+    def __init__(self, parent, department_model, mode="view", on_change=None):
         """
         Initialize department form.
         
@@ -59,6 +62,9 @@ class DepartmentForm(ctk.CTkScrollableFrame):
             department_model: DepartmentModel instance - handles department data operations
             mode: Form mode string - determines what interface to show
                  Options: 'add', 'view', 'update', 'delete'
+            on_change: Function with no arguments called after a department is
+                      added, updated or deleted (optional). MainWindow uses it to
+                      forget its cached department list.
         """
         # Call parent class constructor
         # super() refers to CTkScrollableFrame parent class
@@ -71,6 +77,9 @@ class DepartmentForm(ctk.CTkScrollableFrame):
         # Store form mode
         self.mode = mode
         
+        # Store callback for department changes
+        self.on_change = on_change
+        
         # Create widgets based on mode
         self.create_widgets()
         
@@ -79,6 +88,14 @@ class DepartmentForm(ctk.CTkScrollableFrame):
         if mode == "view":
             self.load_departments()
     
+    def _notify_change(self):
+        """
+        Call the on_change callback (if one was given) after a department
+        was added, updated or deleted.
+        """
+        if self.on_change is not None:
+            self.on_change()
+    
     def create_widgets(self):
         """
         Create form widgets based on current mode.
@@ -100,6 +117,27 @@ class DepartmentForm(ctk.CTkScrollableFrame):
             # Create table view of all departments
             self.create_view_list()
     
+    def refresh(self):
+        """
+        Reload the data shown by the form.
+        
+        MainWindow keeps one form per mode alive and calls this method when
+        the form is shown again, so dropdowns and tables pick up changes
+        made in other forms.
+        """
+        if self.mode == "view":
+            # Reload department table
+            self.load_departments()
+        elif self.mode == "update":
+            # Reload department dropdown (resets selection) and clear the edit form
+            self.load_departments_for_selection()
+            self.on_department_selected()
+        elif self.mode == "delete":
+            # Reload department dropdown (resets selection) and clear the info label
+            self.load_departments_for_delete_selection()
+            self.on_delete_department_selected()
+        # "add" mode has no data to reload
+    
     def create_add_form(self):
         """
         Create form for adding new departments.
@@ -122,7 +160,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             form_frame, 
             text="Add New Department", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).grid(row=0, column=0, columnspan=2, pady=10)
         
         # ========== DEPARTMENT NAME FIELD ==========
@@ -198,7 +236,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             select_frame, 
             text="Select Department to Update", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(pady=5)
         
         # Create frame for dropdown and label (transparent)
@@ -253,7 +291,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             delete_frame, 
             text="Delete Department", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).grid(row=0, column=0, columnspan=2, pady=10)
         
         # Create label for dropdown
@@ -287,7 +325,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
         self.delete_info_label = ctk.CTkLabel(
             delete_frame, 
             text="", 
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.delete_info_label.grid(row=2, column=0, columnspan=2, pady=20)
         
@@ -326,7 +364,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             list_frame, 
             text="All Departments", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(pady=10)
         
         # Create container for table and scrollbar
@@ -418,6 +456,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
                 name=self.name_entry.get().strip(),
                 description=description
             )
+            self._notify_change()
             
             # Show success message
             messagebox.showinfo("Success", "Department added successfully!")
@@ -474,6 +513,24 @@ class DepartmentForm(ctk.CTkScrollableFrame):
             # Silently fail if error occurs
             pass
     
+    def _reset_form_frame(self):
+        """
+        Replace the update form frame with a new, empty one.
+        
+        Destroying the whole frame once is faster than destroying each of
+        its child widgets one by one (each destroy() is a separate Tcl call,
+        and CustomTkinter widgets also clean up their canvases). Tk destroys
+        the children together with the frame.
+        """
+        # Destroy old frame (and all widgets inside it) in one call
+        self.form_frame.destroy()
+        
+        # Create a new empty frame in the same place
+        # It is the last widget packed in update mode, so it ends up below
+        # the department selection dropdown just like the original frame
+        self.form_frame = ctk.CTkFrame(self)
+        self.form_frame.pack(fill="both", expand=True, padx=20, pady=10)
+    
     def on_department_selected(self, choice=None):
         """
         Handle department selection from update dropdown.
@@ -495,8 +552,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
         # If no selection or default option, clear form
         if not selection or selection == "-- Select a Department --":
             # Remove all widgets from form frame
-            for widget in self.form_frame.winfo_children():
-                widget.destroy()
+            self._reset_form_frame()
             # Clear selected department ID
             self.selected_dept_id = None
             return
@@ -545,14 +601,13 @@ class DepartmentForm(ctk.CTkScrollableFrame):
                 return
             
             # Clear existing form widgets
-            for widget in self.form_frame.winfo_children():
-                widget.destroy()
+            self._reset_form_frame()
             
             # Create title label
             ctk.CTkLabel(
                 self.form_frame, 
                 text="Update Department", 
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=get_font(16, "bold")
             ).grid(row=0, column=0, columnspan=2, pady=10)
             
             # ========== CREATE FORM FIELDS WITH PRE-FILLED DATA ==========
@@ -603,6 +658,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
                         name=name_entry.get().strip(),
                         description=description
                     )
+                    self._notify_change()
                     
                     # Show success message
                     messagebox.showinfo("Success", "Department updated successfully!")
@@ -758,6 +814,7 @@ class DepartmentForm(ctk.CTkScrollableFrame):
             try:
                 # Delete department from database
                 self.department_model.delete(self.delete_dept_id)
+                self._notify_change()
                 
                 # Show success message
                 messagebox.showinfo("Success", "Department deleted successfully!")
@@ -792,9 +849,9 @@ class DepartmentForm(ctk.CTkScrollableFrame):
             if hasattr(self, 'tree'):
                 # Clear existing rows
                 # get_children() returns list of all row IDs
-                for item in self.tree.get_children():
-                    # delete() removes a row from table
-                    self.tree.delete(item)
+                # delete(*ids) removes all of them in a single call
+                # (faster than calling delete() once per row)
+                self.tree.delete(*self.tree.get_children())
                 
                 # Get all departments from database
                 departments = self.department_model.get_all()
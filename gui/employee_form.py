@@ -38,6 +38,9 @@ from utils.validators import (
     validate_date        # Check if date format is correct
 )
 
+# Import get_font - returns shared fonts (created once, then reused)
+from gui.fonts import get_font
+
 
 class EmployeeForm(ctk.CTkScrollableFrame):
     """
@@ -55,7 +58,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
     - "search": Show search box and results table
     """
     
-    def __init__(self, parent, employee_model, department_model, mode="view"):
+    def __init__(self, parent, employee_model, department_model, mode="view", get_departments=None):
         """
         Initialize employee form.
         
@@ -65,6 +68,11 @@ class EmployeeForm(ctk.CTkScrollableFrame):
             department_model: DepartmentModel instance - loads departments for dropdown
             mode: Form mode string - determines what interface to show
                  Options: 'add', 'view', 'update', 'delete', 'search'
+            get_departments: Function with no arguments that returns the list of
+                            departments for the dropdown (optional). MainWindow
+                            passes a cached version so switching between forms
+                            doesn't query the database every time. Defaults to
+                            department_model.get_all.
         """
         # Call parent class constructor
         # super() refers to CTkScrollableFrame parent class
@@ -76,6 +84,10 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         self.employee_model = employee_model
         self.department_model = department_model
         
+        # Function used to get the department list for dropdowns
+        # "or" uses department_model.get_all if no function was given
+        self.get_departments = get_departments or department_model.get_all
+        
         # Store form mode
         # This determines which interface to display
         self.mode = mode
@@ -117,6 +129,33 @@ class EmployeeForm(ctk.CTkScrollableFrame):
             # (called in __init__), so we don't need to do anything here
             pass
     
+    def refresh(self):
+        """
+        Reload the data shown by the form.
+        
+        MainWindow keeps one form per mode alive and calls this method when
+        the form is shown again, so dropdowns and tables pick up changes
+        made in other forms (for example a newly added department).
+        """
+        if self.mode == "add":
+            # Reload department dropdown
+            self.load_departments()
+        elif self.mode == "view":
+            # Reload employee table
+            self.load_employees()
+        elif self.mode == "update":
+            # Reload employee dropdown (resets selection) and clear the edit form
+            self.load_employees_for_selection()
+            self.on_employee_selected()
+        elif self.mode == "delete":
+            # Reload employee dropdown (resets selection) and clear the info label
+            self.load_employees_for_delete_selection()
+            self.on_delete_employee_selected()
+        elif self.mode == "search":
+            # Re-run the last search (if any) so results are up to date
+            if self.search_entry.get().strip():
+                self.search_employees()
+    
     def create_add_form(self):
         """
         Create form for adding new employees.
@@ -146,7 +185,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             form_frame, 
             text="Add New Employee", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).grid(row=0, column=0, columnspan=2, pady=10)
         
         # ========== FIRST NAME FIELD ==========
@@ -276,7 +315,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             select_frame, 
             text="Select Employee to Update", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(pady=5)
         
         # Create frame for dropdown and label (transparent)
@@ -332,7 +371,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             delete_frame, 
             text="Delete Employee", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).grid(row=0, column=0, columnspan=2, pady=10)
         
         # Create label for dropdown
@@ -366,7 +405,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         self.delete_info_label = ctk.CTkLabel(
             delete_frame, 
             text="", 
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         )
         self.delete_info_label.grid(row=2, column=0, columnspan=2, pady=20)
         
@@ -409,7 +448,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             list_frame, 
             text="All Employees", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(pady=10)
         
         # Create container for table and scrollbar
@@ -482,7 +521,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             search_frame, 
             text="Search Employees", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(pady=5)
         
         # Create frame for search input and button
@@ -517,7 +556,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             results_frame, 
             text="Search Results", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(pady=5)
         
         # Create container for results table
@@ -559,7 +598,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         try:
             # Get all departments from database
             # get_all() returns list of department dictionaries
-            departments = self.department_model.get_all()
+            departments = self.get_departments()
             
             # Create list of department strings for dropdown
             # Format: "ID: Name" (e.g., "1: IT Department")
@@ -781,6 +820,24 @@ class EmployeeForm(ctk.CTkScrollableFrame):
             # Silently fail if error occurs
             pass
     
+    def _reset_form_frame(self):
+        """
+        Replace the update form frame with a new, empty one.
+        
+        Destroying the whole frame once is faster than destroying each of
+        its child widgets one by one (each destroy() is a separate Tcl call,
+        and CustomTkinter widgets also clean up their canvases). Tk destroys
+        the children together with the frame.
+        """
+        # Destroy old frame (and all widgets inside it) in one call
+        self.form_frame.destroy()
+        
+        # Create a new empty frame in the same place
+        # It is the last widget packed in update mode, so it ends up below
+        # the employee selection dropdown just like the original frame
+        self.form_frame = ctk.CTkFrame(self)
+        self.form_frame.pack(fill="both", expand=True, padx=20, pady=10)
+    
     def on_employee_selected(self, choice=None):
         """
         Handle employee selection from update dropdown.
@@ -802,8 +859,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
         # If no selection or default option, clear form
         if not selection or selection == "-- Select an Employee --":
             # Remove all widgets from form frame
-            for widget in self.form_frame.winfo_children():
-                widget.destroy()
+            self._reset_form_frame()
             # Clear selected employee ID
             self.selected_emp_id = None
             return
@@ -853,14 +909,13 @@ class EmployeeForm(ctk.CTkScrollableFrame):
             
             # Clear existing form widgets
             # This removes any previously displayed form
-            for widget in self.form_frame.winfo_children():
-                widget.destroy()
+            self._reset_form_frame()
             
             # Create title label
             ctk.CTkLabel(
                 self.form_frame, 
                 text="Update Employee", 
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=get_font(16, "bold")
             ).grid(row=0, column=0, columnspan=2, pady=10)
             
             # ========== CREATE FORM FIELDS WITH PRE-FILLED DATA ==========
@@ -929,7 +984,7 @@ class EmployeeForm(ctk.CTkScrollableFrame):
             )
             
             # Load departments into dropdown
-            departments = self.department_model.get_all()
+            departments = self.get_departments()
             dept_list = ["None"] + [
                 f"{d.get('id', '')}: {d.get('name', '')}" 
                 for d in departments
@@ -1178,9 +1233,9 @@ class EmployeeForm(ctk.CTkScrollableFrame):
             if hasattr(self, 'tree'):
                 # Clear existing rows
                 # get_children() returns list of all row IDs
-                for item in self.tree.get_children():
-                    # delete() removes a row from table
-                    self.tree.delete(item)
+                # delete(*ids) removes all of them in a single call
+                # (faster than calling delete() once per row)
+                self.tree.delete(*self.tree.get_children())
                 
                 # Get all employees from database
                 employees = self.employee_model.get_all()
@@ -1239,9 +1294,8 @@ class EmployeeForm(ctk.CTkScrollableFrame):
             messagebox.showwarning("Warning", "Please enter a search term")
             return
         
-        # Clear existing search results
-        for item in self.search_tree.get_children():
-            self.search_tree.delete(item)
+        # Clear existing search results (all rows in one call)
+        self.search_tree.delete(*self.search_tree.get_children())
         
         # Search for employees
         # search() returns list of matching employees
@@ -0,0 +1,45 @@
+"""
+Shared Fonts - Smart Records System
+
+This module hands out the fonts used by the windows and forms.
+
+Creating a CTkFont asks Tk about the font and applies scaling, so building a
+new font object for every label is wasted work. get_font() creates each
+distinct font once and returns the same object every time it is asked for
+again, so all the labels that look the same share one font.
+
+GUI CONCEPTS EXPLAINED:
+- CTkFont: Font object (family, size, weight) that widgets use to draw text
+- lru_cache: Remembers what a function returned for each set of arguments
+"""
+
+# Import CustomTkinter for CTkFont
+import customtkinter as ctk
+
+# Import lru_cache - remembers the font created for each (size, weight, family)
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_font(size, weight="normal", family=None):
+    """
+    Get the shared font with the given size, weight and family.
+    
+    The first call for a combination creates the font; later calls return
+    that same font object. Fonts can't be created at import time because Tk
+    needs a root window first, so this must only be called after the main
+    window exists (for example inside create_widgets()).
+    
+    Args:
+        size: Font size in points
+        weight: "normal" or "bold" (default "normal")
+        family: Font family name, e.g. "Courier" (default: theme font)
+    
+    Returns:
+        CTkFont: Shared font object (don't configure() it - that would
+                 change every widget using it)
+    
+    Example:
+        ctk.CTkLabel(frame, text="Title", font=get_font(16, "bold"))
+    """
+    return ctk.CTkFont(family=family, size=size, weight=weight)
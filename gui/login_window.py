@@ -28,6 +28,9 @@ from tkinter import messagebox
 # Import AuthManager - handles authentication logic (login, registration)
 from auth.auth_manager import AuthManager
 
+# Import get_font - returns shared fonts (created once, then reused)
+from gui.fonts import get_font
+
 
 class LoginWindow:
     """
@@ -131,7 +134,7 @@ class LoginWindow:
         title_label = ctk.CTkLabel(
             self.window, 
             text="Smart Records System", 
-            font=ctk.CTkFont(size=18, weight="bold")  # 18pt font, bold weight
+            font=get_font(18, "bold")  # 18pt font, bold weight
         )
         # pack() places widget in window (simpler than grid for single items)
         # pady=20 adds 20 pixels of vertical padding (space above and below)
@@ -16,7 +16,7 @@ GUI CONCEPTS EXPLAINED:
 - Status bar: Information bar at bottom showing current status
 - Content frame: Main area that displays different forms
 - Menu items: Clickable menu options that trigger actions
-- clear_content(): Removes old widgets before showing new ones
+- Form cache: Each form is built once, then hidden/shown with pack_forget()/pack()
 """
 
 # Import CustomTkinter for modern GUI widgets
@@ -29,13 +29,98 @@ import tkinter as tk
 # Import messagebox for showing popup dialogs
 from tkinter import messagebox
 
+# Import threading to run slow exports without freezing the window
+import threading
+
+# Import time - used to check how old the cached department list is
+import time
+
+# Import functools.partial - creates a function with some arguments already filled in
+# Used to bind menu items to _open_form() with their form kind and mode
+from functools import partial
+
 # Import AuthManager for logout functionality
 from auth.auth_manager import AuthManager
 
-# Import form classes - these create the actual forms displayed in content area
-from gui.employee_form import EmployeeForm
-from gui.department_form import DepartmentForm
-from gui.report_window import ReportWindow
+# Import get_font - returns shared fonts (created once, then reused)
+from gui.fonts import get_font
+
+# NOTE: The form classes (EmployeeForm, DepartmentForm, ReportWindow) are
+# imported inside the menu handlers instead of here. They pull in the models
+# and a lot of widget code, so importing them lazily lets the main window
+# appear sooner. Python caches imported modules, so later clicks are free.
+
+
+# Menu bar layout used by MainWindow.create_menu()
+# Each entry is (menu label, items), where items is a tuple of
+# (item label, action, shortcut key) entries. (None, None, None) adds a separator.
+# The action is either:
+# - a (form kind, mode) tuple - opens that form with MainWindow._open_form()
+#   and shows the item label in the status bar
+# - a string - the name of the MainWindow method to call
+# The shortcut key is a letter used with Ctrl (e.g. "n" means Ctrl+N), or None
+# for no shortcut. An upper-case letter means Ctrl+Shift (e.g. "N" is Ctrl+Shift+N).
+# If items is a string instead of a tuple, the entry is a direct menu bar
+# command (like Logout) and the string is the handler method name.
+_MENU_SPEC = (
+    ("Employees", (
+        ("Add Employee", ("employee", "add"), "n"),
+        ("View All Employees", ("employee", "view"), "e"),
+        ("Search Employees", ("employee", "search"), "f"),
+        (None, None, None),
+        ("Update Employee", ("employee", "update"), "u"),
+        ("Delete Employee", ("employee", "delete"), "d"),
+    )),
+    ("Departments", (
+        ("Add Department", ("department", "add"), "N"),
+        ("View All Departments", ("department", "view"), "E"),
+        (None, None, None),
+        ("Update Department", ("department", "update"), "U"),
+        ("Delete Department", ("department", "delete"), "D"),
+    )),
+    ("Reports", (
+        ("Generate Reports", "show_reports", "r"),
+        ("Export to PDF", "export_pdf", "p"),
+        ("Export to TXT", "export_txt", "t"),
+        (None, None, None),
+        ("Export Summary to PDF", "export_summary_pdf", None),
+        ("Export Summary to TXT", "export_summary_txt", None),
+    )),
+    ("Help", (
+        ("About", "show_about", None),
+    )),
+    ("Logout", "logout"),
+)
+
+
+# Reports menu items that start an export (disabled while an export is running)
+_EXPORT_MENU_ITEMS = (
+    "Export to PDF",
+    "Export to TXT",
+    "Export Summary to PDF",
+    "Export Summary to TXT",
+)
+
+
+# How long (in seconds) the department list used by employee forms is cached
+# Changes made through the department forms clear the cache right away;
+# the time limit catches changes made outside this window
+_DEPT_CACHE_SECONDS = 30
+
+
+# Title and text of the Help → About dialog
+# The text never changes, so it is built once when the module is imported
+_ABOUT_TITLE = "About Smart Records System"
+_ABOUT_TEXT = (
+    "Smart Records System v1.0\n\n"
+    "A GUI-based database application for managing\n"
+    "employee and department records.\n\n"
+    "Features:\n"
+    "- User authentication\n"
+    "- CRUD operations\n"
+    "- Report generation\n"
+    "- PDF and TXT export"
+)
 
 
 class MainWindow:
@@ -76,6 +161,47 @@ class MainWindow:
         self.department_model = department_model
         self.db_manager = db_manager
         
+        # Cache of forms that have already been built
+        # Key is (form kind, mode), e.g. ("employee", "add"), value is the form widget
+        # Forms are hidden with pack_forget() instead of destroyed, so switching
+        # back to a form doesn't rebuild its widgets or reload its dropdowns
+        self._form_cache = {}
+        
+        # The widget currently shown in the content area (welcome screen or a form)
+        self._current_form = None
+        
+        # "Loading report..." label shown while the report data is loaded
+        # on a background thread (created the first time it is needed)
+        self._loading_label = None
+        
+        # True while the report data is being loaded in the background
+        self._report_loading = False
+        
+        # Cached department list for the employee forms' dropdowns
+        # (see _get_departments) and the time it was loaded
+        self._dept_cache = None
+        self._dept_cache_time = 0
+        
+        # Yes/No dialog used to confirm logout (created when first needed)
+        self._confirm_dialog = None
+        
+        # Progress bar shown while an export is running (created when first needed)
+        self._export_progress = None
+        
+        # ReportGenerator shared by exports and the report window
+        # (created when first needed - see _get_report_generator)
+        self._report_generator = None
+        
+        # Get current logged-in user once and remember it
+        # The user can't change while this window is open (logging out closes it),
+        # so there is no need to ask the auth manager again later
+        # get_current_user() returns dict with user info or None
+        self._current_user = self.auth_manager.get_current_user()
+        
+        # Extract username from user dict
+        # .get() safely gets 'username' key, uses 'User' as default if not found
+        self._username = self._current_user.get('username', 'User') if self._current_user else 'User'
+        
         # Set window title (appears in title bar)
         self.root.title("Smart Records System")
         
@@ -90,23 +216,30 @@ class MainWindow:
         # Create main widgets (status bar, content area, welcome screen)
         self.create_widgets()
         
-        # Get current logged-in user
-        # get_current_user() returns dict with user info or None
-        current_user = self.auth_manager.get_current_user()
-        
         # If user is logged in, show welcome message
-        if current_user:
-            # Extract username from user dict
-            # .get() safely gets 'username' key, uses 'User' as default if not found
-            username = current_user.get('username', 'User')
-            
-            # Show welcome popup dialog
-            # showinfo() displays an information dialog
-            # \n\n creates blank lines for better formatting
-            messagebox.showinfo(
-                "Welcome", 
-                f"Welcome, {username}!\n\nUse the menu bar to navigate through the system."
-            )
+        if self._current_user:
+            # Show welcome popup once the window has finished drawing
+            # after_idle() runs the function when Tk has no other work pending,
+            # so the main window appears first instead of a blank window
+            self.root.after_idle(self._show_welcome, self._username)
+    
+    def _show_welcome(self, username):
+        """
+        Show the welcome popup dialog.
+        
+        Scheduled with after_idle() from __init__ so the dialog (which blocks
+        until closed) doesn't stop the main window from painting.
+        
+        Args:
+            username: Name of the logged-in user
+        """
+        # Show welcome popup dialog
+        # showinfo() displays an information dialog
+        # \n\n creates blank lines for better formatting
+        messagebox.showinfo(
+            "Welcome", 
+            f"Welcome, {username}!\n\nUse the menu bar to navigate through the system."
+        )
     
     def create_menu(self):
         """
@@ -115,10 +248,15 @@ class MainWindow:
         The menu bar contains:
         - Employees menu (Add, View, Search, Update, Delete)
         - Departments menu (Add, View, Update, Delete)
-        - Reports menu (Generate, Export PDF, Export TXT)
+        - Reports menu (Generate, Export PDF/TXT, Export Summary PDF/TXT)
         - Help menu (About)
         - Logout button
         
+        The layout comes from the _MENU_SPEC table at the top of this module,
+        so this method is just one loop over that table. Items with a shortcut
+        key also get a Ctrl+<key> keyboard binding, so they can be used without
+        opening the menu.
+        
         Menu bars use tkinter's Menu widget (not CustomTkinter).
         """
         # Create main menu bar
@@ -130,63 +268,139 @@ class MainWindow:
         # config(menu=menubar) sets this as the window's menu bar
         self.root.config(menu=menubar)
         
-        # ========== EMPLOYEES MENU ==========
-        # Create Employees submenu
-        # This will contain all employee-related actions
-        employees_menu = tk.Menu(menubar, tearoff=0)
-        
-        # Add Employees menu to menu bar
-        # add_cascade() creates a dropdown menu
-        # label="Employees" is what appears in menu bar
-        menubar.add_cascade(label="Employees", menu=employees_menu)
-        
-        # Add menu items to Employees menu
-        # add_command() adds a clickable menu item
-        # command=self.add_employee calls the method when clicked
-        employees_menu.add_command(label="Add Employee", command=self.add_employee)
-        employees_menu.add_command(label="View All Employees", command=self.view_employees)
-        employees_menu.add_command(label="Search Employees", command=self.search_employees)
-        
-        # Add separator line (visual divider)
-        # add_separator() draws a horizontal line in the menu
-        employees_menu.add_separator()
-        
-        # Add update and delete options (separated from view/search)
-        employees_menu.add_command(label="Update Employee", command=self.update_employee)
-        employees_menu.add_command(label="Delete Employee", command=self.delete_employee)
-        
-        # ========== DEPARTMENTS MENU ==========
-        # Create Departments submenu
-        departments_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Departments", menu=departments_menu)
-        
-        # Add department menu items
-        departments_menu.add_command(label="Add Department", command=self.add_department)
-        departments_menu.add_command(label="View All Departments", command=self.view_departments)
-        departments_menu.add_separator()
-        departments_menu.add_command(label="Update Department", command=self.update_department)
-        departments_menu.add_command(label="Delete Department", command=self.delete_department)
-        
-        # ========== REPORTS MENU ==========
-        # Create Reports submenu
-        reports_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Reports", menu=reports_menu)
-        
-        # Add report menu items
-        reports_menu.add_command(label="Generate Reports", command=self.show_reports)
-        reports_menu.add_command(label="Export to PDF", command=self.export_pdf)
-        reports_menu.add_command(label="Export to TXT", command=self.export_txt)
-        
-        # ========== HELP MENU ==========
-        # Create Help submenu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=self.show_about)
-        
-        # ========== LOGOUT BUTTON ==========
-        # Add logout as a direct menu item (not in submenu)
-        # This makes it easily accessible
-        menubar.add_command(label="Logout", command=self.logout)
+        # Keep references so menu items can be changed later
+        # (e.g. disabling export items while an export is running)
+        self._menubar = menubar
+        self._menus = {}
+        
+        # Keyboard shortcuts: (lower-case letter, shift pressed) -> (menu, item label)
+        # Used by _on_shortcut() to find the menu item for a key press
+        self._shortcuts = {}
+        
+        # Build each menu from the spec table
+        for label, items in _MENU_SPEC:
+            # A string instead of a list of items means a direct menu bar command
+            # (like Logout) rather than a dropdown menu
+            if isinstance(items, str):
+                menubar.add_command(label=label, command=getattr(self, items))
+                continue
+            
+            # Create submenu and add it to menu bar
+            # add_cascade() creates a dropdown menu
+            submenu = tk.Menu(menubar, tearoff=0)
+            menubar.add_cascade(label=label, menu=submenu)
+            self._menus[label] = submenu
+            
+            # Add menu items to the submenu
+            for item_label, action, key in items:
+                if item_label is None:
+                    # Add separator line (visual divider)
+                    submenu.add_separator()
+                    continue
+                
+                command = self._menu_command(item_label, action)
+                if key is None:
+                    submenu.add_command(label=item_label, command=command)
+                    continue
+                
+                # accelerator= only shows the shortcut text next to the item
+                # (e.g. "Ctrl+N"); the actual key binding is made below
+                submenu.add_command(
+                    label=item_label,
+                    command=command,
+                    accelerator=self._accelerator_text(key)
+                )
+                
+                # Remember which item the key belongs to (see _on_shortcut)
+                # An upper-case letter in the spec means Ctrl+Shift
+                self._shortcuts[(key.lower(), key.isupper())] = (submenu, item_label)
+        
+        # bind_all() makes the shortcuts work anywhere in the window
+        # Both the lower- and upper-case key are bound, because the key name
+        # Tk reports depends on Shift and Caps Lock; _on_shortcut() looks at
+        # the Shift key itself to pick the item
+        for letter in {letter for letter, shifted in self._shortcuts}:
+            self.root.bind_all(f"<Control-{letter}>", self._on_shortcut)
+            self.root.bind_all(f"<Control-{letter.upper()}>", self._on_shortcut)
+    
+    def _on_shortcut(self, event):
+        """
+        Run the menu item for a Ctrl+<key> (or Ctrl+Shift+<key>) shortcut.
+        
+        Shortcuts are ignored while typing in a text field: Entry and Text
+        widgets have their own Ctrl+<key> editing keys (e.g. Ctrl+E moves to
+        the end of the line), and switching forms from there would also throw
+        away what the user was typing.
+        
+        They are also ignored while a modal dialog (e.g. the logout
+        ConfirmDialog) is open, because bind_all() bindings still get the
+        keys then and would run menu items behind the dialog.
+        
+        Args:
+            event: Key event (event.keysym is the key, event.state holds the
+                   modifier keys)
+            
+        Returns:
+            str or None: "break" if a menu item was run (stops other
+                         bindings), None if the key was left to the widget
+        """
+        # CTkEntry and CTkTextbox are built on tk.Entry and tk.Text, and
+        # event.widget is that inner widget
+        if isinstance(event.widget, (tk.Entry, tk.Text)):
+            return None
+        
+        # grab_current() returns the window that has grabbed all input
+        # (a modal dialog, see grab_set()), or None if there is none
+        if self.root.grab_current() is not None:
+            return None
+        
+        # event.state is a set of bit flags; bit 0x0001 is the Shift key
+        # (Caps Lock is a different bit, so it doesn't count as Shift)
+        shifted = bool(event.state & 0x0001)
+        entry = self._shortcuts.get((event.keysym.lower(), shifted))
+        if entry is None:
+            return None
+        
+        # invoke() runs the menu item like a click, so disabled items
+        # (e.g. exports while one is already running) are skipped
+        menu, item_label = entry
+        menu.invoke(item_label)
+        return "break"
+    
+    @staticmethod
+    def _accelerator_text(key):
+        """
+        Build the shortcut text shown next to a menu item.
+        
+        Args:
+            key: Shortcut letter from _MENU_SPEC ("n" or "N")
+            
+        Returns:
+            str: "Ctrl+N" for "n", "Ctrl+Shift+N" for "N"
+        """
+        if key.isupper():
+            return f"Ctrl+Shift+{key}"
+        return f"Ctrl+{key.upper()}"
+    
+    def _menu_command(self, item_label, action):
+        """
+        Turn a menu spec action into a function the menu can call.
+        
+        Args:
+            item_label: Menu item text (also used as the status bar text for forms)
+            action: (form kind, mode) tuple, or a method name string
+            
+        Returns:
+            Function with no arguments
+        """
+        # A method name - getattr(self, action) looks up the method, e.g. self.show_about
+        if isinstance(action, str):
+            return getattr(self, action)
+        
+        # A (kind, mode) tuple - partial() fills in the arguments for _open_form
+        # e.g. partial(self._open_form, "employee", "add", "Add Employee")
+        kind, mode = action
+        return partial(self._open_form, kind, mode, item_label)
     
     def create_widgets(self):
         """
@@ -197,16 +411,32 @@ class MainWindow:
         - Content frame (main area that displays forms)
         - Welcome screen (initial content)
         """
+        # Build the initial status text in one go
+        # If user is logged in, show username in status bar
+        if self._current_user:
+            status_text = f"Logged in as: {self._username} | Ready"
+        else:
+            status_text = "Ready"
+        
+        # Variable that holds the status bar text
+        # The label is linked to it with textvariable=..., so calling
+        # self._status_var.set("...") updates the label. This is cheaper than
+        # status_bar.configure(text=...), which makes CustomTkinter redraw the widget
+        self._status_var = tk.StringVar(master=self.root, value=status_text)
+        
+        # Last text written to the status bar (see _set_status)
+        self._last_status = status_text
+        
         # Create status bar (information bar at bottom of window)
         # CTkLabel creates a text label widget
-        # text="Ready" is the initial status message
+        # textvariable links the label text to self._status_var
         # anchor="w" aligns text to west (left side)
         # padx=10, pady=5 adds padding (space around text)
         # fg_color sets foreground color (background color of label)
         # ("gray75", "gray25") means light gray in light mode, dark gray in dark mode
         self.status_bar = ctk.CTkLabel(
             self.root, 
-            text="Ready", 
+            textvariable=self._status_var, 
             anchor="w", 
             padx=10, 
             pady=5, 
@@ -218,20 +448,6 @@ class MainWindow:
         # fill="x" makes it fill entire width
         self.status_bar.pack(side="bottom", fill="x")
         
-        # Update status bar with current user info
-        # Get current logged-in user
-        current_user = self.auth_manager.get_current_user()
-        
-        # If user is logged in, show username in status bar
-        if current_user:
-            # Extract username safely
-            # Ternary operator: use username if current_user exists, else 'User'
-            username = current_user.get('username', 'User') if current_user else 'User'
-            
-            # Update status bar text
-            # configure() changes widget properties after creation
-            self.status_bar.configure(text=f"Logged in as: {username} | Ready")
-        
         # Create content frame (main area that displays forms)
         # This is where EmployeeForm, DepartmentForm, ReportWindow will be displayed
         self.content_frame = ctk.CTkFrame(self.root)
@@ -242,274 +458,452 @@ class MainWindow:
         # padx=20, pady=20 adds padding around frame
         self.content_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Create welcome label (shown when window first opens)
+        # Create welcome frame (shown when window first opens)
         # This is the initial content before user selects a menu item
+        # It is hidden (not destroyed) when the first form is shown
+        self._welcome_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self._welcome_frame.pack(fill="both", expand=True)
+        self._current_form = self._welcome_frame
+        
+        # Create welcome label
         welcome_label = ctk.CTkLabel(
-            self.content_frame,
+            self._welcome_frame,
             text="Smart Records System",
-            font=ctk.CTkFont(size=24, weight="bold")  # Large, bold text
+            font=get_font(24, "bold")  # Large, bold text (shared font)
         )
         welcome_label.pack(pady=50)  # Add vertical spacing
         
         # Create info label (instructions for user)
         info_label = ctk.CTkLabel(
-            self.content_frame,
+            self._welcome_frame,
             text="Use the menu bar to manage employees, departments, and generate reports.",
-            font=ctk.CTkFont(size=12)  # Smaller, normal text
+            font=get_font(12)  # Smaller, normal text (shared font)
         )
         info_label.pack(pady=20)
     
-    def clear_content(self):
+    def _set_status(self, text):
         """
-        Clear the main content area.
+        Change the status bar text.
         
-        This method removes all widgets from content_frame.
-        It's called before displaying a new form to ensure old content is removed.
+        Does nothing if the text is already shown (e.g. the user clicks
+        "View All Employees" twice), so the label isn't redrawn for nothing.
         
-        This is important because we reuse the same content_frame for different forms.
-        Without clearing, old widgets would remain visible.
+        Args:
+            text: New status bar text
         """
-        # Loop through all child widgets in content_frame
-        # winfo_children() returns a list of all widgets inside content_frame
-        for widget in self.content_frame.winfo_children():
-            # Destroy each widget (remove from screen and free memory)
-            # destroy() removes widget and all its children
-            widget.destroy()
+        if text != self._last_status:
+            self._status_var.set(text)
+            self._last_status = text
     
-    def add_employee(self):
+    def _swap_to(self, key, factory):
         """
-        Open the "Add Employee" form.
+        Show a cached form in the content area.
+        
+        The form currently on screen is hidden with pack_forget() (it stays alive
+        in the cache). If a form for this key was built before, it is refreshed
+        and shown again; otherwise factory() builds it and it is cached.
+        If the form for this key is already on screen, it is only refreshed.
         
-        This method is called when user clicks "Employees → Add Employee" menu.
-        It clears the content area and displays EmployeeForm in "add" mode.
+        Args:
+            key: Cache key, a (form kind, mode) tuple, e.g. ("employee", "add")
+            factory: Function with no arguments that creates the form
+                    (can be None if the form is known to be cached already)
+            
+        Returns:
+            The form widget now shown in the content area
         """
-        # Clear any existing content
-        self.clear_content()
+        form = self._form_cache.get(key)
         
-        # Create EmployeeForm in "add" mode
-        # EmployeeForm is a scrollable form widget
-        # mode="add" tells the form to show add employee interface
-        form = EmployeeForm(
-            self.content_frame,           # Parent widget (where form will be placed)
-            self.employee_model,          # For saving employee data
-            self.department_model,        # For loading department dropdown
-            mode="add"                    # Form mode: add, view, update, delete, search
-        )
+        # Same form picked again from the menu - it is already packed, so
+        # just reload its data (hiding and re-packing it would make Tk
+        # lay out the whole content area again for nothing)
+        if form is not None and form is self._current_form:
+            form.refresh()
+            return form
+        
+        # Hide the current form (or welcome screen) without destroying it
+        if self._current_form is not None:
+            self._current_form.pack_forget()
+        
+        # Reuse the cached form if we have one, otherwise build it
+        if form is None:
+            form = self._form_cache[key] = factory()
+        else:
+            # Reload data so the form shows changes made in other forms
+            form.refresh()
         
         # Pack form to fill content area
         form.pack(fill="both", expand=True)
+        self._current_form = form
+        return form
+    
+    def _open_form(self, kind, mode, title):
+        """
+        Open an employee or department form in the content area.
+        
+        Called by the Employees and Departments menu items (see _MENU_SPEC).
+        For example "Employees → Add Employee" calls
+        _open_form("employee", "add", "Add Employee").
+        
+        Args:
+            kind: "employee" (EmployeeForm) or "department" (DepartmentForm)
+            mode: Form mode: add, view, update, delete (and search for employees)
+            title: Text shown in the status bar
+        """
+        if kind == "employee":
+            # Import the form class here (not at the top of the file) so it is
+            # only loaded when the user first opens this form
+            from gui.employee_form import EmployeeForm
+            
+            # The lambda is only called the first time, to build the form
+            # EmployeeForm needs the department model for its department dropdown
+            factory = lambda: EmployeeForm(
+                self.content_frame,           # Parent widget (where form will be placed)
+                self.employee_model,          # For saving employee data
+                self.department_model,        # For loading department dropdown
+                mode=mode,                    # Form mode: add, view, update, delete, search
+                get_departments=self._get_departments  # Cached department list
+            )
+        else:
+            from gui.department_form import DepartmentForm
+            factory = lambda: DepartmentForm(
+                self.content_frame, 
+                self.department_model, 
+                mode=mode,
+                on_change=self._invalidate_departments  # Departments changed - clear cache
+            )
+        
+        # Show the cached form for this kind and mode (built on first use)
+        self._swap_to((kind, mode), factory)
         
         # Update status bar to show current action
-        self.status_bar.configure(text="Add Employee")
+        self._set_status(title)
     
-    def view_employees(self):
+    def _get_departments(self):
         """
-        View all employees in a table.
+        Get the list of departments, using a cached copy when possible.
         
-        Called when user clicks "Employees → View All Employees".
-        Displays EmployeeForm in "view" mode (shows table of all employees).
+        Every employee form (add, update) fills a department dropdown. Without
+        a cache, switching between them queries the database each time for
+        the same rows. The list is reloaded when it is older than
+        _DEPT_CACHE_SECONDS or after _invalidate_departments() was called.
+        
+        Returns:
+            list: Department dictionaries from department_model.get_all()
+        """
+        # time.monotonic() is a clock that never goes backwards (good for measuring age)
+        now = time.monotonic()
+        if self._dept_cache is None or now - self._dept_cache_time > _DEPT_CACHE_SECONDS:
+            self._dept_cache = self.department_model.get_all()
+            self._dept_cache_time = now
+        return self._dept_cache
+    
+    def _invalidate_departments(self):
         """
-        self.clear_content()
+        Forget the cached department list.
         
-        # Create form in "view" mode (displays employee list)
-        form = EmployeeForm(
-            self.content_frame, 
-            self.employee_model,
-            self.department_model, 
-            mode="view"
-        )
-        form.pack(fill="both", expand=True)
-        self.status_bar.configure(text="View All Employees")
+        Called by the department forms after a department is added,
+        updated or deleted, so the next dropdown shows the change.
+        """
+        self._dept_cache = None
     
-    def search_employees(self):
+    def show_reports(self):
         """
-        Open employee search interface.
+        Show reports window with statistics and listings.
+        
+        Called when user clicks "Reports → Generate Reports".
+        Displays ReportWindow which shows comprehensive report.
         
-        Called when user clicks "Employees → Search Employees".
-        Displays EmployeeForm in "search" mode (shows search box and results).
+        The first time, the report data is loaded on a background thread
+        (the queries can take a while) and a "Loading report..." label is
+        shown meanwhile. _mount_report() then builds the ReportWindow.
         """
-        self.clear_content()
-        form = EmployeeForm(
-            self.content_frame, 
-            self.employee_model,
-            self.department_model, 
-            mode="search"
-        )
-        form.pack(fill="both", expand=True)
-        self.status_bar.configure(text="Search Employees")
+        from gui.report_window import ReportWindow
+        
+        if ("report", "report") in self._form_cache:
+            # Show the cached ReportWindow
+            # When shown again, refresh() regenerates the report with latest data
+            self._swap_to(("report", "report"), None)
+        else:
+            # Show loading label while the data is loaded
+            self._show_loading()
+            
+            # Only start one load at a time (the user may click again while loading)
+            if not self._report_loading:
+                self._report_loading = True
+                threading.Thread(
+                    target=self._load_report_data,
+                    args=(ReportWindow,),
+                    daemon=True
+                ).start()
+        
+        self._set_status("Generate Reports")
     
-    def update_employee(self):
+    def _show_loading(self):
+        """
+        Show the "Loading report..." label in the content area.
         """
-        Open employee update form.
+        # Create the label the first time it is needed
+        if self._loading_label is None:
+            self._loading_label = ctk.CTkLabel(self.content_frame, text="")
+        self._loading_label.configure(text="Loading report...")
         
-        Called when user clicks "Employees → Update Employee".
-        Displays EmployeeForm in "update" mode (shows dropdown to select employee, then edit form).
+        # Hide the current form and show the label instead
+        if self._current_form is not None:
+            self._current_form.pack_forget()
+        self._loading_label.pack(pady=50)
+        self._current_form = self._loading_label
+    
+    def _load_report_data(self, report_class):
         """
-        self.clear_content()
-        form = EmployeeForm(
-            self.content_frame, 
-            self.employee_model,
-            self.department_model, 
-            mode="update"
-        )
-        form.pack(fill="both", expand=True)
-        self.status_bar.configure(text="Update Employee")
+        Load the report data (called on a background thread).
+        
+        Like _run_export(), this must NOT touch any widgets. The result is
+        passed to _mount_report() on the main thread through root.after().
+        
+        Args:
+            report_class: The ReportWindow class (its fetch_data() runs the queries)
+        """
+        data = None
+        error = None
+        try:
+            # Run the database queries (this is the slow part)
+            data = report_class.fetch_data(self.employee_model, self.department_model)
+        except Exception as e:
+            # Keep the error so the main thread can show it
+            error = e
+        
+        try:
+            self.root.after(0, self._mount_report, report_class, data, error)
+        except (RuntimeError, tk.TclError):
+            # Window was closed while loading - nothing left to update
+            pass
     
-    def delete_employee(self):
+    def _mount_report(self, report_class, data, error):
         """
-        Open employee deletion interface.
+        Build the ReportWindow from loaded data (called on the main thread).
         
-        Called when user clicks "Employees → Delete Employee".
-        Displays EmployeeForm in "delete" mode (shows dropdown to select employee, then delete button).
+        Args:
+            report_class: The ReportWindow class
+            data: Report data from ReportWindow.fetch_data(), or None if loading failed
+            error: Exception raised while loading, or None if it succeeded
         """
-        self.clear_content()
-        form = EmployeeForm(
+        self._report_loading = False
+        
+        if error is not None:
+            # Show the error where the report would be
+            # The report window isn't cached, so the next click tries again
+            self._loading_label.configure(text=f"Error generating report: {str(error)}")
+            return
+        
+        # Create the report window from the loaded data and cache it
+        # prefetched=data means it doesn't query the database again
+        form = report_class(
             self.content_frame, 
             self.employee_model,
             self.department_model, 
-            mode="delete"
+            self.db_manager,
+            prefetched=data,
+            get_generator=self._get_report_generator  # Shared ReportGenerator
         )
-        form.pack(fill="both", expand=True)
-        self.status_bar.configure(text="Delete Employee")
+        self._form_cache[("report", "report")] = form
+        
+        # Only show it if the user is still waiting for it
+        # (if they opened another form meanwhile, it stays cached for later)
+        if self._current_form is self._loading_label:
+            self._loading_label.pack_forget()
+            form.pack(fill="both", expand=True)
+            self._current_form = form
     
-    def add_department(self):
+    def export_pdf(self):
         """
-        Open the "Add Department" form.
+        Export report to PDF file.
         
-        Called when user clicks "Departments → Add Department".
-        Displays DepartmentForm in "add" mode.
+        Called when user clicks "Reports → Export to PDF".
+        Creates a PDF file in reports_output/ folder.
+        
+        This method:
+        1. Gets the shared ReportGenerator
+        2. Starts export_to_pdf() on a background thread
+        3. Shows success/error message when it finishes (see _export_done)
+        4. Updates status bar
         """
-        self.clear_content()
-        form = DepartmentForm(
-            self.content_frame, 
-            self.department_model, 
-            mode="add"
-        )
-        form.pack(fill="both", expand=True)
-        self.status_bar.configure(text="Add Department")
+        # Run the export in the background so the window doesn't freeze
+        # while reportlab builds the PDF
+        self._start_export(self._get_report_generator().export_to_pdf, "PDF")
     
-    def view_departments(self):
+    def export_txt(self):
         """
-        View all departments in a table.
+        Export report to text file.
+        
+        Called when user clicks "Reports → Export to TXT".
+        Creates a TXT file in reports_output/ folder.
         
-        Called when user clicks "Departments → View All Departments".
-        Displays DepartmentForm in "view" mode.
+        Similar to export_pdf() but creates text file instead.
         """
-        self.clear_content()
-        form = DepartmentForm(
-            self.content_frame, 
-            self.department_model, 
-            mode="view"
-        )
-        form.pack(fill="both", expand=True)
-        self.status_bar.configure(text="View All Departments")
+        self._start_export(self._get_report_generator().export_to_txt, "TXT")
     
-    def update_department(self):
+    def export_summary_pdf(self):
         """
-        Open department update form.
+        Export a summary-only report to PDF file.
         
-        Called when user clicks "Departments → Update Department".
-        Displays DepartmentForm in "update" mode.
+        Called when user clicks "Reports → Export Summary to PDF".
+        Like export_pdf(), but without the employee listing: the employees
+        are not queried, so this stays fast however many employees there are.
         """
-        self.clear_content()
-        form = DepartmentForm(
-            self.content_frame, 
-            self.department_model, 
-            mode="update"
+        self._start_export(
+            partial(self._get_report_generator().export_to_pdf, include_employees=False),
+            "PDF"
         )
-        form.pack(fill="both", expand=True)
-        self.status_bar.configure(text="Update Department")
     
-    def delete_department(self):
+    def export_summary_txt(self):
         """
-        Open department deletion interface.
+        Export a summary-only report to text file.
         
-        Called when user clicks "Departments → Delete Department".
-        Displays DepartmentForm in "delete" mode.
+        Called when user clicks "Reports → Export Summary to TXT".
+        Like export_txt(), but without the employee listing.
         """
-        self.clear_content()
-        form = DepartmentForm(
-            self.content_frame, 
-            self.department_model, 
-            mode="delete"
+        self._start_export(
+            partial(self._get_report_generator().export_to_txt, include_employees=False),
+            "TXT"
         )
-        form.pack(fill="both", expand=True)
-        self.status_bar.configure(text="Delete Department")
     
-    def show_reports(self):
+    def _get_report_generator(self):
         """
-        Show reports window with statistics and listings.
+        Get the ReportGenerator, creating it the first time it is needed.
         
-        Called when user clicks "Reports → Generate Reports".
-        Displays ReportWindow which shows comprehensive report.
-        """
-        self.clear_content()
+        One generator is shared by the Reports menu exports and the report
+        window (it only holds the two models, so it can be reused freely).
         
-        # Create ReportWindow
-        # ReportWindow displays formatted report with statistics
-        report_window = ReportWindow(
-            self.content_frame, 
-            self.employee_model,
-            self.department_model, 
-            self.db_manager
-        )
-        report_window.pack(fill="both", expand=True)
-        self.status_bar.configure(text="Generate Reports")
+        Returns:
+            ReportGenerator: Shared generator
+        """
+        if self._report_generator is None:
+            # Import ReportGenerator (imported here to avoid circular imports)
+            from reports.report_generator import ReportGenerator
+            self._report_generator = ReportGenerator(self.employee_model, self.department_model)
+        return self._report_generator
     
-    def export_pdf(self):
+    def _start_export(self, export_func, kind):
         """
-        Export report to PDF file.
+        Start a report export on a background (worker) thread.
         
-        Called when user clicks "Reports → Export to PDF".
-        Creates a PDF file in reports_output/ folder.
+        Tkinter can only redraw the window while the main loop is running.
+        Exports can take several seconds, so they run on a separate thread
+        and the result is handed back to the main loop when done.
         
-        This method:
-        1. Creates ReportGenerator
-        2. Calls export_to_pdf() to generate PDF
-        3. Shows success/error message
-        4. Updates status bar
+        Args:
+            export_func: Function that writes the file and returns its path
+                        (generator.export_to_pdf or generator.export_to_txt)
+            kind: "PDF" or "TXT" (used in messages)
+        """
+        # Disable export menu items so the user can't start a second export
+        # while this one is still running
+        self._set_export_menu_state("disabled")
+        self._set_status(f"Exporting {kind} report...")
+        
+        # Show a moving progress bar above the status bar
+        self._show_export_progress(True)
+        
+        # Create and start worker thread
+        # daemon=True means the thread won't keep the app alive after the window closes
+        threading.Thread(
+            target=self._run_export,
+            args=(export_func, kind),
+            daemon=True
+        ).start()
+    
+    def _run_export(self, export_func, kind):
         """
-        # Import ReportGenerator (imported here to avoid circular imports)
-        from reports.report_generator import ReportGenerator
+        Run the export (called on the worker thread).
         
-        # Create report generator
-        generator = ReportGenerator(self.employee_model, self.department_model)
+        This method must NOT touch any widgets - Tk widgets are only safe to
+        use from the main thread. It passes the result to _export_done()
+        through root.after(), which runs it on the main thread.
         
-        # Try to export PDF
+        Args:
+            export_func: Function that writes the file and returns its path
+            kind: "PDF" or "TXT"
+        """
+        filename = None
+        error = None
         try:
-            # Generate PDF file
-            # export_to_pdf() returns the file path
-            filename = generator.export_to_pdf()
-            
-            # Show success message with file path
-            messagebox.showinfo("Success", f"Report exported to {filename}")
-            
-            # Update status bar
-            self.status_bar.configure(text=f"Report exported to {filename}")
+            # Generate the file (this is the slow part)
+            filename = export_func()
         except Exception as e:
-            # If export fails, show error message
+            # Keep the error so the main thread can show it
             # Common reasons: reportlab not installed, disk full, permission error
-            messagebox.showerror("Error", f"Failed to export PDF: {str(e)}")
+            error = e
+        
+        try:
+            # after(0, ...) asks the main loop to call _export_done as soon as possible
+            self.root.after(0, self._export_done, filename, kind, error)
+        except (RuntimeError, tk.TclError):
+            # Window was closed while exporting - nothing left to update
+            pass
     
-    def export_txt(self):
+    def _export_done(self, filename, kind, error):
         """
-        Export report to text file.
+        Finish an export (called on the main thread).
         
-        Called when user clicks "Reports → Export to TXT".
-        Creates a TXT file in reports_output/ folder.
+        Re-enables the export menu items and shows the result to the user.
         
-        Similar to export_pdf() but creates text file instead.
+        Args:
+            filename: Path of the exported file, or None if export failed
+            kind: "PDF" or "TXT"
+            error: Exception raised by the export, or None if it succeeded
         """
-        from reports.report_generator import ReportGenerator
-        generator = ReportGenerator(self.employee_model, self.department_model)
+        # Allow exporting again and hide the progress bar
+        self._set_export_menu_state("normal")
+        self._show_export_progress(False)
         
-        try:
-            # Generate TXT file
-            filename = generator.export_to_txt()
-            messagebox.showinfo("Success", f"Report exported to {filename}")
-            self.status_bar.configure(text=f"Report exported to {filename}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to export TXT: {str(e)}")
+        if error is not None:
+            # If export failed, show error message
+            messagebox.showerror("Error", f"Failed to export {kind}: {str(error)}")
+            self._set_status(f"Failed to export {kind}")
+            return
+        
+        # Show success message with file path
+        messagebox.showinfo("Success", f"Report exported to {filename}")
+        
+        # Update status bar
+        self._set_status(f"Report exported to {filename}")
+    
+    def _show_export_progress(self, running):
+        """
+        Show or hide the export progress bar above the status bar.
+        
+        The bar is created the first time an export starts and is hidden
+        (not destroyed) afterwards, so later exports reuse it.
+        
+        Args:
+            running: True when an export starts, False when it is finished
+        """
+        if self._export_progress is None:
+            # mode="indeterminate" shows a moving bar (the export doesn't
+            # report how far along it is)
+            self._export_progress = ctk.CTkProgressBar(self.root, mode="indeterminate")
+        
+        if running:
+            # before=self.content_frame places the bar between the content
+            # area and the status bar (both are already packed)
+            self._export_progress.pack(side="bottom", fill="x", before=self.content_frame)
+            self._export_progress.start()
+        else:
+            self._export_progress.stop()
+            self._export_progress.pack_forget()
+    
+    def _set_export_menu_state(self, state):
+        """
+        Enable or disable the export menu items.
+        
+        Args:
+            state: "normal" (enabled) or "disabled" (grayed out)
+        """
+        reports_menu = self._menus["Reports"]
+        # entryconfig() changes a menu item; the item is found by its label
+        for label in _EXPORT_MENU_ITEMS:
+            reports_menu.entryconfig(label, state=state)
     
     def show_about(self):
         """
@@ -518,18 +912,24 @@ class MainWindow:
         Called when user clicks "Help → About".
         Displays a popup with app version and features.
         """
-        # Show information dialog
-        messagebox.showinfo(
-            "About Smart Records System",  # Dialog title
-            "Smart Records System v1.0\n\n"  # Dialog content
-            "A GUI-based database application for managing\n"
-            "employee and department records.\n\n"
-            "Features:\n"
-            "- User authentication\n"
-            "- CRUD operations\n"
-            "- Report generation\n"
-            "- PDF and TXT export"
-        )
+        # Show information dialog (text is a constant at the top of this module)
+        messagebox.showinfo(_ABOUT_TITLE, _ABOUT_TEXT)
+    
+    def _get_confirm_dialog(self):
+        """
+        Get the Yes/No confirmation dialog, creating it the first time.
+        
+        The dialog is hidden (not destroyed) after each answer, so the same
+        one is reused instead of rebuilding its widgets every time.
+        
+        Returns:
+            ConfirmDialog: The shared dialog
+        """
+        if self._confirm_dialog is None:
+            # Imported here because the dialog is only needed when logging out
+            from gui.confirm_dialog import ConfirmDialog
+            self._confirm_dialog = ConfirmDialog(self.root)
+        return self._confirm_dialog
     
     def logout(self):
         """
@@ -539,17 +939,25 @@ class MainWindow:
         This method:
         1. Confirms logout with user
         2. Calls AuthManager.logout() to clear session
-        3. Closes the application (quits main loop)
+        3. Closes the application (destroys the window, which ends the main loop)
         
         After logout, user must login again to access the system.
         """
         # Ask user to confirm logout
-        # askyesno() shows Yes/No dialog, returns True if Yes clicked
-        if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+        # ask() shows Yes/No dialog, returns True if Yes clicked
+        # The dialog keeps the main loop running while it waits (unlike
+        # messagebox.askyesno), so background exports can still finish
+        if self._get_confirm_dialog().ask("Logout", "Are you sure you want to logout?"):
             # User confirmed - logout
             # Clear current user session
             self.auth_manager.logout()
             
-            # Quit the application
-            # quit() stops the main event loop and closes all windows
-            self.root.quit()
+            # Forget the remembered user so nothing shows stale user info
+            self._current_user = None
+            self._username = 'User'
+            
+            # Close the application
+            # destroy() removes the window and all its widgets right away, which
+            # also ends mainloop(). quit() would only stop the main loop and leave
+            # the widgets (and CustomTkinter's callbacks for them) alive
+            self.root.destroy()
@@ -22,12 +22,85 @@ GUI CONCEPTS EXPLAINED:
 # Import CustomTkinter for modern GUI widgets
 import customtkinter as ctk
 
+# Import tkinter for TclError (raised when using a window that was closed)
+import tkinter as tk
+
 # Import messagebox for popup dialogs
 from tkinter import messagebox
 
-# Import ReportGenerator for generating and exporting reports
-from reports.report_generator import ReportGenerator
+# Import difflib - finds which lines changed between two versions of the report
+import difflib
+
+# Import io for StringIO - collects the report text written by write_report()
+import io
+
+# Import ThreadPoolExecutor - runs slow work (database queries, exports)
+# on a background thread so the window keeps responding
+from concurrent.futures import ThreadPoolExecutor
+
+# Import contextmanager - lets a simple function be used in a "with" block
+from contextlib import contextmanager
+
+# Import get_font - returns shared fonts (created once, then reused)
+from gui.fonts import get_font
+
+# Import VirtualTable - scrollable table that only draws the visible rows
+from gui.virtual_table import VirtualTable
+
+# Import the text report builder (shared with the TXT export)
+from reports.report_text import (
+    EMPLOYEE_TABLE_HEADER,   # Column headings of the employee listing
+    fetch_report_data,       # Runs the report queries
+    format_employee_row,     # Formats one employee row
+    write_report             # Writes the report text
+)
+
+# NOTE: ReportGenerator is imported in _get_generator() (not here), so its
+# module is only loaded when the report is first exported
+
+
+@contextmanager
+def _editable(textbox):
+    """
+    Unlock a read-only textbox for the changes made inside a "with" block.
+    
+    The report text area is kept disabled (read-only) except while the
+    report is written into it. This only switches the state - it doesn't
+    stop Tk from redrawing. It doesn't need to: Tk redraws a widget when it
+    is idle (after the current callback has finished), so all the changes
+    made in one callback are shown together anyway.
+    
+    Example:
+        with _editable(self.report_text):
+            self.report_text.delete("1.0", "end")
+            self.report_text.insert("1.0", report)
+    
+    Args:
+        textbox: CTkTextbox to change
+    """
+    # state="normal" allows the text to be changed
+    textbox.configure(state="normal")
+    try:
+        # Run the code inside the "with" block
+        yield textbox
+    finally:
+        # Lock the text again (even if an error happened)
+        textbox.configure(state="disabled")
+
 
+# Number of report lines put into the text area at a time
+# Long reports (for example many departments) are inserted in batches with a
+# short pause between them, so the window keeps responding while the text is added
+_INSERT_BATCH_LINES = 500
+
+# Largest number of changed blocks that are patched line by line on refresh
+# If more parts of the report changed, it is faster to replace all the text
+_MAX_PATCH_BLOCKS = 100
+
+# Delay (in milliseconds) before a requested refresh runs
+# Several refresh requests within this time (e.g. quick clicks on Refresh)
+# are combined into one, so the report is only rebuilt once
+_REFRESH_DELAY_MS = 75
 
 class ReportWindow(ctk.CTkScrollableFrame):
     """
@@ -41,7 +114,8 @@ class ReportWindow(ctk.CTkScrollableFrame):
     capability if the report is longer than the visible area.
     """
     
-    def __init__(self, parent, employee_model, department_model, db_manager):
+    def __init__(self, parent, employee_model, department_model, db_manager, prefetched=None,
+                 get_generator=None):
         """
         Initialize report window.
         
@@ -50,6 +124,13 @@ class ReportWindow(ctk.CTkScrollableFrame):
             employee_model: EmployeeModel instance - for getting employee data
             department_model: DepartmentModel instance - for getting department data
             db_manager: DatabaseManager instance - for database operations (not used directly here)
+            prefetched: Report data already loaded with fetch_data() (optional)
+                       If given, the report is shown from it without querying
+                       the database again. MainWindow loads it on a background
+                       thread so the window doesn't freeze while the queries run.
+            get_generator: Function that returns a shared ReportGenerator
+                          (optional - MainWindow passes its own, so exports
+                          from the menu and from this window use one generator)
         """
         # Call parent class constructor
         # super() refers to CTkScrollableFrame parent class
@@ -61,16 +142,51 @@ class ReportWindow(ctk.CTkScrollableFrame):
         self.department_model = department_model
         self.db_manager = db_manager
         
-        # Create ReportGenerator instance
-        # This handles report generation and export functionality
-        self.report_generator = ReportGenerator(employee_model, department_model)
+        # ReportGenerator instance - handles report export functionality
+        # Created (or got from get_generator) the first time it is needed
+        # (see _get_generator)
+        self._report_generator = None
+        self._generator_source = get_generator
+        
+        # Worker thread for database queries and exports
+        # max_workers=1 means jobs run one at a time, in the order they were started
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
+        # False once the window is destroyed (checked before updating widgets
+        # with results from the worker thread)
+        self._alive = True
+        
+        # Data and text of the report currently shown (see display_report)
+        # Used to skip rebuilding the report when Refresh finds no changes
+        self._last_data = None
+        self._last_report = None
+        
+        # ID of the scheduled after() call for a requested refresh
+        # (None when no refresh is waiting - see request_refresh)
+        self._refresh_after_id = None
+        
+        # True while a report is being built on the worker thread
+        # If a refresh is asked for meanwhile, _rebuild_pending is set and
+        # the report is built once more when the current build is done
+        self._building = False
+        self._rebuild_pending = False
+        
+        # ID of the scheduled after() call that inserts the next batch of
+        # report lines (None when no insert is in progress)
+        self._insert_after_id = None
         
         # Create widgets (buttons, text area, etc.)
         self.create_widgets()
         
         # Generate and display initial report
-        # This shows the report immediately when window opens
-        self.generate_summary()
+        if prefetched is None:
+            # Shows a "Loading report..." placeholder and builds the report on
+            # the worker thread, so the window appears immediately instead of
+            # waiting for the database queries
+            self.generate_summary()
+        else:
+            # Data was already loaded - just format and show it
+            self.display_report(prefetched)
     
     def create_widgets(self):
         """
@@ -79,6 +195,7 @@ class ReportWindow(ctk.CTkScrollableFrame):
         This method creates:
         - Control buttons (Refresh, Export PDF, Export TXT)
         - Report text area (displays formatted report)
+        - Employee table (lists every employee, only visible rows are drawn)
         """
         # Create frame for control buttons
         # fg_color="transparent" makes frame invisible (no background)
@@ -87,11 +204,12 @@ class ReportWindow(ctk.CTkScrollableFrame):
         control_frame.pack(fill="x", padx=10, pady=10)
         
         # Create Refresh button
-        # command=self.generate_summary reloads the report with latest data
+        # command=self.request_refresh reloads the report with latest data
+        # (quick repeated clicks only reload it once)
         refresh_button = ctk.CTkButton(
             control_frame, 
             text="Refresh", 
-            command=self.generate_summary, 
+            command=self.request_refresh, 
             width=120
         )
         refresh_button.pack(side="left", padx=5)
@@ -116,6 +234,18 @@ class ReportWindow(ctk.CTkScrollableFrame):
         )
         txt_button.pack(side="left", padx=5)
         
+        # Export buttons are disabled while an export is running (see _start_export)
+        self._export_buttons = (pdf_button, txt_button)
+        
+        # Create progress bar shown while an export is running
+        # mode="indeterminate" shows a moving bar (we don't know how far along
+        # the export is); it is only packed while an export is running
+        self._export_progress = ctk.CTkProgressBar(
+            control_frame, 
+            mode="indeterminate", 
+            width=150
+        )
+        
         # Create frame for report display
         report_frame = ctk.CTkFrame(self)
         report_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -124,7 +254,7 @@ class ReportWindow(ctk.CTkScrollableFrame):
         ctk.CTkLabel(
             report_frame, 
             text="Report Summary", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=get_font(16, "bold")
         ).pack(pady=10)
         
         # Create text area for displaying report
@@ -132,24 +262,102 @@ class ReportWindow(ctk.CTkScrollableFrame):
         # wrap="word" wraps text at word boundaries (not mid-word)
         # font sets font family and size (Courier is monospace, good for reports)
         # width and height set initial dimensions
+        # undo=False turns off the undo history - otherwise Tk keeps a copy
+        # of every insert and delete, which only costs memory for a report
+        # state="disabled" makes the report read-only (see _editable())
         self.report_text = ctk.CTkTextbox(
             report_frame,
             wrap="word",  # Wrap text at word boundaries
-            font=ctk.CTkFont(family="Courier", size=10),  # Monospace font for alignment
+            font=get_font(10, family="Courier"),  # Monospace font for alignment
             width=800,    # Initial width in pixels
-            height=500    # Initial height in pixels
+            height=500,   # Initial height in pixels
+            undo=False,   # No undo history
+            state="disabled"  # Read-only
         )
         # Pack text area to fill available space
         self.report_text.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Create label for employee listing section
+        ctk.CTkLabel(
+            report_frame, 
+            text="Employee Listing", 
+            font=get_font(16, "bold")
+        ).pack(pady=10)
+        
+        # Create table for the employee listing
+        # The listing can have thousands of rows, so instead of putting them
+        # all in the text area, VirtualTable keeps them in a list and only
+        # formats and draws the rows that are on screen
+        # header is the column headings (without the last "\n")
+        self.employee_table = VirtualTable(
+            report_frame,
+            format_row=format_employee_row,  # Called only for visible rows
+            header=EMPLOYEE_TABLE_HEADER.rstrip("\n"),
+            empty_text="No employees found.",
+            height=400
+        )
+        self.employee_table.pack(fill="both", expand=True, padx=10, pady=10)
+    
+    def _get_generator(self):
+        """
+        Get the ReportGenerator, creating it the first time it is needed.
+        
+        Returns:
+            ReportGenerator: Shared generator for this window
+        """
+        if self._report_generator is None:
+            if self._generator_source is not None:
+                # Use the generator shared by the main window
+                self._report_generator = self._generator_source()
+            else:
+                # Import here instead of at the top of the file (see note there)
+                from reports.report_generator import ReportGenerator
+                self._report_generator = ReportGenerator(self.employee_model, self.department_model)
+        return self._report_generator
+    
+    def refresh(self):
+        """
+        Reload the report with the latest data.
+        
+        Called by MainWindow when the cached report window is shown again.
+        """
+        self.request_refresh()
+    
+    def request_refresh(self):
+        """
+        Ask for the report to be reloaded after a short delay.
+        
+        If another request comes in before the delay is over, the earlier
+        one is cancelled, so a burst of requests rebuilds the report only
+        once. Other parts of the app should call this instead of
+        generate_summary() directly.
+        """
+        # Cancel the refresh that is already waiting (if any)
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        
+        # Schedule the refresh to run after _REFRESH_DELAY_MS milliseconds
+        self._refresh_after_id = self.after(_REFRESH_DELAY_MS, self._do_refresh)
+    
+    def _do_refresh(self):
+        """
+        Run the refresh scheduled by request_refresh().
+        """
+        self._refresh_after_id = None
+        self.generate_summary()
     
     def generate_summary(self):
         """
         Generate and display summary report.
         
         This method:
-        1. Queries database for statistics and data
-        2. Formats data into a readable report
-        3. Displays report in the text area
+        1. Queries database for statistics and data (fetch_data)
+        2. Formats data into a readable report (format_report)
+        3. Displays report in the text area (_show_report)
+        
+        Steps 1 and 2 run on a background thread, so the window keeps
+        responding while the database is queried. Step 3 runs back on the
+        main thread because Tk widgets may only be used from there.
         
         The report includes:
         - Summary statistics (total employees, average salary, etc.)
@@ -157,226 +365,436 @@ class ReportWindow(ctk.CTkScrollableFrame):
         - Complete employee listing
         - Complete department listing
         """
+        # A report is already being built - build it again once that one is
+        # done (any number of refreshes meanwhile only cause one more build),
+        # instead of queueing a build on the worker thread for each of them
+        if self._building:
+            self._rebuild_pending = True
+            return
+        self._building = True
+        
+        # If no report is shown yet, show a placeholder while loading
+        # (on refresh the old report stays visible until the new one is ready)
+        if self._last_report is None:
+            with _editable(self.report_text):
+                self.report_text.delete("1.0", "end")
+                self.report_text.insert("1.0", "Loading report...")
+        
+        # Data of the report shown now, read here on the main thread
+        # (_apply_report changes _last_data on this thread, so the worker
+        # thread gets its own copy of the reference instead of reading it)
+        last_data = self._last_data if self._last_report is not None else None
+        
+        # submit() runs _build_report on the worker thread and returns a Future
+        # (an object that will hold the result when the work is finished)
+        future = self._executor.submit(self._build_report, last_data)
+        
+        # Called when the work is finished (on the worker thread)
+        future.add_done_callback(self._on_report_built)
+    
+    def _build_report(self, last_data):
+        """
+        Query the database and format the report (runs on the worker thread).
+        
+        This method must NOT touch any widgets or change the window's attributes.
+        
+        Args:
+            last_data: Data of the report currently shown, or None if no
+                       report is shown
+        
+        Returns:
+            tuple: (data, report) - report is None if data is
+                   unchanged since the report currently shown
+        """
+        data = self.fetch_data(self.employee_model, self.department_model)
+        
+        # Same data as the report already shown - no need to format it again
+        # == compares the stats dict and every employee/department row
+        if last_data is not None and data == last_data:
+            return data, None
+        
+        return data, self.format_report(data)
+    
+    def _on_report_built(self, future):
+        """
+        Hand the finished report back to the main thread.
+        
+        Args:
+            future: Future returned by self._executor.submit()
+        """
         try:
-            # Get employee statistics from database
-            # get_statistics() returns dict with: total_employees, avg_salary, min_salary, max_salary, total_salary
-            stats = self.employee_model.get_statistics()
-            
-            # Get all employees from database
-            # get_all() returns list of employee dictionaries
-            employees = self.employee_model.get_all()
-            
-            # Get all departments from database
-            # get_all() returns list of department dictionaries
-            departments = self.department_model.get_all()
-            
-            # ========== BUILD REPORT TEXT ==========
-            # Start building report string
-            # "=" * 80 creates a line of 80 equal signs (decorative separator)
-            report = "=" * 80 + "\n"
-            
-            # Add report title (centered)
-            # " " * 25 adds 25 spaces before title (centers it)
-            report += " " * 25 + "SMART RECORDS SYSTEM REPORT\n"
-            report += "=" * 80 + "\n\n"
-            
-            # ========== SUMMARY STATISTICS SECTION ==========
-            report += "SUMMARY STATISTICS\n"
-            report += "-" * 80 + "\n"  # Separator line
-            
-            # Add total employees count
-            # .get() safely gets value, uses 0 as default if not found
-            report += f"Total Employees: {stats.get('total_employees', 0)}\n"
-            
-            # Add total departments count
-            # len() gets number of items in list
-            report += f"Total Departments: {len(departments)}\n"
-            
-            # Add salary statistics (only if there are employees)
-            if stats.get('total_employees', 0) > 0:
-                # Get salary values (use 0 as default if None)
-                avg_salary = stats.get('avg_salary', 0) or 0
-                min_salary = stats.get('min_salary', 0) or 0
-                max_salary = stats.get('max_salary', 0) or 0
-                total_salary = stats.get('total_salary', 0) or 0
-                
-                # Format salary with currency symbol and commas
-                # :,.2f formats number with commas and 2 decimal places
-                # Example: 50000 becomes "50,000.00"
-                report += f"Average Salary: ${avg_salary:,.2f}\n"
-                report += f"Minimum Salary: ${min_salary:,.2f}\n"
-                report += f"Maximum Salary: ${max_salary:,.2f}\n"
-                report += f"Total Salary Budget: ${total_salary:,.2f}\n"
-            
-            # Add separator
-            report += "\n" + "=" * 80 + "\n\n"
-            
-            # ========== DEPARTMENT-WISE EMPLOYEE COUNT SECTION ==========
-            report += "DEPARTMENT-WISE EMPLOYEE COUNT\n"
-            report += "-" * 80 + "\n"
-            
-            # Count employees per department
-            # Create dictionary to store counts
-            dept_employee_count = {}
-            
-            # Loop through all employees
-            for emp in employees:
-                # Get department name (or "No Department" if None)
-                dept_name = emp.get('department_name', 'No Department')
-                
-                # Increment count for this department
-                # .get() gets current count (0 if department not in dict yet)
-                # Then add 1
-                dept_employee_count[dept_name] = dept_employee_count.get(dept_name, 0) + 1
-            
-            # Add department counts to report (sorted alphabetically)
-            # sorted() sorts dictionary items by key (department name)
-            for dept_name, count in sorted(dept_employee_count.items()):
-                report += f"{dept_name}: {count} employee(s)\n"
-            
-            # Add separator
-            report += "\n" + "=" * 80 + "\n\n"
-            
-            # ========== EMPLOYEE LISTING SECTION ==========
-            report += "EMPLOYEE LISTING\n"
-            report += "-" * 80 + "\n"
-            
-            # Check if there are employees
-            if employees:
-                # Create table header
-                # Format: column names with spacing
-                # <5 means left-align, width 5 characters
-                # <25 means left-align, width 25 characters
-                report += f"{'ID':<5} {'Name':<25} {'Email':<25} {'Position':<15} {'Salary':<12} {'Department':<15}\n"
-                report += "-" * 80 + "\n"  # Separator line
-                
-                # Add each employee as a row
-                for emp in employees:
-                    try:
-                        # Extract and format employee data
-                        # Combine first and last name
-                        name = f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip()
-                        
-                        email = emp.get('email', 'N/A')
-                        
-                        # Use "N/A" if position is None or empty
-                        position = emp.get('position') or "N/A"
-                        
-                        # Format salary with currency symbol
-                        salary_val = emp.get('salary')
-                        # If salary exists and is not 0, format it; otherwise show "N/A"
-                        salary = f"${salary_val:.2f}" if salary_val is not None and salary_val != 0 else "N/A"
-                        
-                        dept = emp.get('department_name', 'N/A')
-                        emp_id = emp.get('id', 'N/A')
-                        
-                        # Add employee row to report
-                        # Format aligns columns using spacing
-                        report += f"{emp_id:<5} {name:<25} {email:<25} {position:<15} {salary:<12} {dept:<15}\n"
-                    except Exception:
-                        # Skip this employee if error occurs (prevents crash)
-                        continue
-            else:
-                # No employees found
-                report += "No employees found.\n"
-            
-            # Add separator
-            report += "\n" + "=" * 80 + "\n\n"
-            
-            # ========== DEPARTMENT LISTING SECTION ==========
-            report += "DEPARTMENT LISTING\n"
-            report += "-" * 80 + "\n"
-            
-            # Check if there are departments
-            if departments:
-                # Create table header
-                report += f"{'ID':<5} {'Name':<30} {'Description':<40}\n"
-                report += "-" * 80 + "\n"
-                
-                # Add each department as a row
-                for dept in departments:
-                    try:
-                        # Extract department data
-                        name = dept.get('name', 'N/A')
-                        
-                        # Get description (limit to 40 characters)
-                        # [:40] slices string to first 40 characters
-                        desc = (dept.get('description') or "N/A")[:40]
-                        
-                        dept_id = dept.get('id', 'N/A')
-                        
-                        # Add department row to report
-                        report += f"{dept_id:<5} {name:<30} {desc:<40}\n"
-                    except Exception:
-                        # Skip this department if error occurs
-                        continue
-            else:
-                # No departments found
-                report += "No departments found.\n"
-            
-            # ========== REPORT FOOTER ==========
-            report += "\n" + "=" * 80 + "\n"
-            
-            # Add generation timestamp
-            # get_current_date() returns formatted date/time string
-            report += f"Report generated on: {self.report_generator.get_current_date()}\n"
-            report += "=" * 80 + "\n"
+            # after(0, ...) asks the main loop to call _apply_report as soon as possible
+            self.after(0, self._apply_report, future)
+        except (RuntimeError, tk.TclError):
+            # Window was closed while the report was being built
+            pass
+    
+    def _apply_report(self, future):
+        """
+        Show the report built on the worker thread (runs on the main thread).
+        
+        Args:
+            future: Finished Future from _build_report
+        """
+        # Window was destroyed meanwhile - nothing to show the report in
+        if not self._alive:
+            return
+        
+        self._building = False
+        
+        try:
+            # result() returns what _build_report returned,
+            # or raises the exception that happened on the worker thread
+            data, report = future.result()
+        except Exception as e:
+            # If error occurs, display error message
+            self.show_error(e)
+        else:
+            self._show_report(data, report)
+        
+        # A refresh was asked for while this report was being built, so it
+        # may be out of date already - build it once more
+        if self._rebuild_pending:
+            self._rebuild_pending = False
+            self.generate_summary()
+    
+    @staticmethod
+    def fetch_data(employee_model, department_model):
+        """
+        Query the database for the report data.
+        
+        This method does not touch any widgets, so it is safe to call from a
+        background thread (MainWindow does this when the report is first opened).
+        
+        Args:
+            employee_model: EmployeeModel instance
+            department_model: DepartmentModel instance
             
-            # Display report in text area
-            # delete("1.0", "end") clears existing text
-            # "1.0" means line 1, character 0 (start)
-            # "end" means end of text
+        Returns:
+            dict: {'stats': dict, 'employees': list, 'dept_counts': list,
+                   'departments': list}
+        """
+        # The queries are shared with the TXT export (see reports/report_text.py)
+        return fetch_report_data(employee_model, department_model)
+    
+    def show_error(self, error):
+        """
+        Show an error message in the report text area.
+        
+        Args:
+            error: Exception that stopped the report from being generated
+        """
+        # Stop inserting a previous report (if still in progress)
+        self._cancel_insert()
+        
+        with _editable(self.report_text):
             self.report_text.delete("1.0", "end")
-            
-            # insert("1.0", report) adds report text at beginning
-            self.report_text.insert("1.0", report)
-            
+            self.report_text.insert("1.0", f"Error generating report: {str(error)}")
+        
+        # Clear the employee table
+        self.employee_table.set_rows([])
+        
+        # The report is no longer shown, so the next refresh must rebuild it
+        self._last_data = None
+        self._last_report = None
+    
+    def display_report(self, data):
+        """
+        Format report data and display it in the text area.
+        
+        Used when the data was already loaded (the prefetched argument),
+        so it runs directly on the main thread.
+        
+        If the data is the same as last time, the report already shown is
+        kept as it is (nothing is formatted or redrawn).
+        
+        Args:
+            data: Report data dict returned by fetch_data()
+        """
+        # Same data as the report already shown - nothing to rebuild
+        if self._last_report is not None and data == self._last_data:
+            self._show_report(data, None)
+            return
+        
+        try:
+            report = self.format_report(data)
         except Exception as e:
             # If error occurs, display error message
-            self.report_text.delete("1.0", "end")
-            self.report_text.insert("1.0", f"Error generating report: {str(e)}")
+            self.show_error(e)
+            return
+        
+        self._show_report(data, report)
+    
+    def _show_report(self, data, report):
+        """
+        Put the report text into the text area.
+        
+        Args:
+            data: Report data the text was built from
+            report: Report text, or None if the data is unchanged and the
+                   report already shown should be kept
+        """
+        if report is None:
+            # The text area is read-only, so the report shown is still
+            # exactly _last_report - nothing to do
+            return
+        
+        old_report = self._last_report
+        
+        # Remember what is shown so an unchanged refresh can skip all this
+        self._last_data = data
+        self._last_report = report
+        
+        # Show the employees in the employee table
+        # (only the rows on screen are drawn, so this is quick for any number)
+        self.employee_table.set_rows(data['employees'])
+        
+        # If the previous report is fully shown, only change the lines that
+        # differ; otherwise replace all the text
+        # (the text area is read-only, so it can't have been edited)
+        if (old_report is not None
+                and self._insert_after_id is None
+                and self._patch_text(old_report, report)):
+            return
+        
+        # Display report in text area
+        self._insert_text(report)
+    
+    def _patch_text(self, old_report, new_report):
+        """
+        Update the text area by changing only the lines that differ.
+        
+        On a refresh usually only a few lines change (a salary, one employee,
+        the timestamp), so this is much less work for Tk than deleting and
+        inserting the whole report.
+        
+        Args:
+            old_report: Report text currently shown in the text area
+            new_report: New report text
+            
+        Returns:
+            bool: True if the text area was patched, False if too much
+                  changed (the caller should replace all the text instead)
+        """
+        # Split into lines, keeping the "\n" at the end of each line
+        old_lines = old_report.splitlines(keepends=True)
+        new_lines = new_report.splitlines(keepends=True)
+        
+        # get_opcodes() describes how to turn old_lines into new_lines as a
+        # list of (tag, i1, i2, j1, j2): old_lines[i1:i2] should become
+        # new_lines[j1:j2]. tag is 'equal' for parts that didn't change.
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+        changes = [op for op in matcher.get_opcodes() if op[0] != 'equal']
+        
+        if len(changes) > _MAX_PATCH_BLOCKS:
+            return False
+        
+        # Apply the changes from the bottom up, so changing a block doesn't
+        # shift the line numbers of the blocks above it
+        # All blocks are changed in this one callback, so Tk draws them
+        # together when it is idle again
+        with _editable(self.report_text):
+            for tag, i1, i2, j1, j2 in reversed(changes):
+                # Text widget lines start at 1, list indexes start at 0
+                # "5.0" means line 5, character 0
+                # Deleting from line i1+1 to line i2+1 removes old_lines[i1:i2]
+                self.report_text.delete(f"{i1 + 1}.0", f"{i2 + 1}.0")
+                self.report_text.insert(f"{i1 + 1}.0", "".join(new_lines[j1:j2]))
+        
+        return True
+    
+    def _insert_text(self, text):
+        """
+        Replace the text area contents with text, in batches of lines.
+        
+        The first batch (header, statistics, department counts and the first
+        employee rows) appears right away; the rest follows in later batches.
+        
+        Args:
+            text: Report text to show
+        """
+        # Stop inserting a previous report (if still in progress)
+        self._cancel_insert()
+        
+        # splitlines(keepends=True) splits into lines but keeps the "\n" on each
+        # The first batch clears the old text (see _insert_batch)
+        self._insert_batch(text.splitlines(keepends=True), 0)
+    
+    def _insert_batch(self, lines, start):
+        """
+        Insert one batch of lines and schedule the next batch.
+        
+        Args:
+            lines: All report lines
+            start: Index of the first line of this batch
+        """
+        self._insert_after_id = None
+        end = start + _INSERT_BATCH_LINES
+        
+        with _editable(self.report_text):
+            # The first batch replaces the old text in the same callback, so
+            # Tk never draws the empty text area in between
+            # "1.0" means line 1, character 0 (start); "end" means end of text
+            if start == 0:
+                self.report_text.delete("1.0", "end")
+            
+            # insert("end", ...) adds the text after what is already there
+            # "".join() turns the batch of lines into one string (one insert call)
+            self.report_text.insert("end", "".join(lines[start:end]))
+        
+        # More lines left - insert them after a short pause (1 ms), which lets
+        # Tk redraw the window and handle clicks in between
+        if end < len(lines):
+            self._insert_after_id = self.after(1, self._insert_batch, lines, end)
+    
+    def _cancel_insert(self):
+        """
+        Cancel the next scheduled batch insert (if there is one).
+        """
+        if self._insert_after_id is not None:
+            # after_cancel() stops a scheduled after() call from running
+            self.after_cancel(self._insert_after_id)
+            self._insert_after_id = None
+    
+    def format_report(self, data):
+        """
+        Format report data into the report text.
+        
+        The text has the statistics, department counts and department
+        listing. The employee listing is shown in the employee table
+        instead (see _show_report). The text itself is built by
+        write_report(), which the TXT export uses too.
+        
+        This method does not touch any widgets, so it can run on the
+        worker thread.
+        
+        Args:
+            data: Report data dict returned by fetch_data()
+            
+        Returns:
+            str: The complete report text
+        """
+        # write_report() writes the text piece by piece; StringIO collects
+        # the pieces and getvalue() joins them into one string at the end
+        # include_employees=False leaves out the employee listing (it is
+        # shown in the employee table instead)
+        out = io.StringIO()
+        write_report(out, data, include_employees=False)
+        return out.getvalue()
     
     def export_pdf(self):
         """
         Export report to PDF file.
         
         This method:
-        1. Calls ReportGenerator.export_to_pdf() to create PDF
+        1. Calls ReportGenerator.export_to_pdf() on the worker thread to create PDF
         2. Shows success message with file path
         3. Shows error message if export fails
         
         The PDF file is saved in reports_output/ folder with timestamp.
         """
-        try:
-            # Generate PDF file
-            # export_to_pdf() creates PDF and returns file path
-            filename = self.report_generator.export_to_pdf()
-            
-            # Show success message
-            messagebox.showinfo("Success", f"Report exported to {filename}")
-        except Exception as e:
-            # Show error message if export fails
-            # Common reasons: reportlab not installed, disk full, permission error
-            messagebox.showerror("Error", f"Failed to export PDF: {str(e)}")
+        self._start_export(self._get_generator().export_to_pdf, "PDF")
     
     def export_txt(self):
         """
         Export report to text file.
         
         This method:
-        1. Calls ReportGenerator.export_to_txt() to create TXT file
+        1. Calls ReportGenerator.export_to_txt() on the worker thread to create TXT file
         2. Shows success message with file path
         3. Shows error message if export fails
         
         The TXT file is saved in reports_output/ folder with timestamp.
         """
+        self._start_export(self._get_generator().export_to_txt, "TXT")
+    
+    def _start_export(self, export_func, kind):
+        """
+        Run an export on the worker thread so the window doesn't freeze.
+        
+        The export buttons are disabled and a progress bar is shown until
+        the export finishes (see _export_done).
+        
+        Args:
+            export_func: Function that writes the file and returns its path
+            kind: "PDF" or "TXT" (used in messages)
+        """
+        self._set_exporting(True)
+        
+        future = self._executor.submit(export_func)
+        
+        def on_done(finished):
+            # Runs on the worker thread - pass the result to the main thread
+            try:
+                self.after(0, self._export_done, finished, kind)
+            except (RuntimeError, tk.TclError):
+                # Window was closed while exporting
+                pass
+        
+        future.add_done_callback(on_done)
+    
+    def _export_done(self, future, kind):
+        """
+        Show the result of an export (runs on the main thread).
+        
+        Args:
+            future: Finished Future from _start_export
+            kind: "PDF" or "TXT"
+        """
+        if not self._alive:
+            return
+        
+        # Hide the progress bar and allow exporting again
+        self._set_exporting(False)
+        
         try:
-            # Generate TXT file
-            # export_to_txt() creates text file and returns file path
-            filename = self.report_generator.export_to_txt()
-            
-            # Show success message
-            messagebox.showinfo("Success", f"Report exported to {filename}")
+            # Get file path (or the error raised by the export)
+            filename = future.result()
         except Exception as e:
             # Show error message if export fails
-            messagebox.showerror("Error", f"Failed to export TXT: {str(e)}")
+            # Common reasons: reportlab not installed, disk full, permission error
+            messagebox.showerror("Error", f"Failed to export {kind}: {str(e)}")
+            return
+        
+        # Show success message
+        messagebox.showinfo("Success", f"Report exported to {filename}")
+    
+    def _set_exporting(self, running):
+        """
+        Show or hide the export progress bar and disable or enable the export buttons.
+        
+        Args:
+            running: True when an export starts, False when it is finished
+        """
+        # state="disabled" grays out the buttons so a second export can't be
+        # started while this one is still running
+        state = "disabled" if running else "normal"
+        for button in self._export_buttons:
+            button.configure(state=state)
+        
+        if running:
+            # start() makes the indeterminate bar move back and forth
+            self._export_progress.pack(side="left", padx=10)
+            self._export_progress.start()
+        else:
+            self._export_progress.stop()
+            self._export_progress.pack_forget()
+    
+    def destroy(self):
+        """
+        Destroy the window and stop its worker thread.
+        
+        Work that is still running is not waited for; _alive tells its
+        callbacks that there is no window left to update.
+        """
+        self._alive = False
+        
+        # Cancel scheduled work that would use the destroyed widgets
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        self._cancel_insert()
+        
+        # shutdown(wait=False) lets the worker thread finish on its own
+        self._executor.shutdown(wait=False)
+        super().destroy()
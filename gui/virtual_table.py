@@ -0,0 +1,332 @@
+"""
+Virtual Table - Smart Records System
+
+This module creates a scrollable table that only draws the rows that are
+visible on screen.
+
+A Text widget (or a Treeview) stores and lays out every row it is given, so
+with thousands of employees Tk does a lot of work for rows nobody is looking
+at. VirtualTable keeps the rows in a normal Python list and uses a Canvas
+with one text item per visible line. Scrolling just changes which rows those
+few text items show, so the cost is the same for 10 rows or 100,000 rows.
+
+GUI CONCEPTS EXPLAINED:
+- Canvas: Drawing area; create_text() puts a piece of text on it
+- itemconfigure(): Changes an existing canvas item (here: the text it shows)
+- CTkScrollbar: Scrollbar whose position we set ourselves with set()
+- scrollregion: Size of the area a canvas can scroll over; xview() scrolls
+  the canvas sideways within it (used for rows wider than the table)
+- <Configure>: Event sent when a widget is resized
+- <MouseWheel>: Mouse wheel event (Windows/macOS); Linux sends <Button-4>/<Button-5>
+"""
+
+# Import CustomTkinter for modern GUI widgets
+import customtkinter as ctk
+
+# Import tkinter for Canvas (CustomTkinter has no plain canvas widget)
+import tkinter as tk
+
+# Import get_font - returns shared fonts (created once, then reused)
+from gui.fonts import get_font
+
+
+# Number of rows moved by one step of the mouse wheel
+_WHEEL_ROWS = 3
+
+
+class VirtualTable(ctk.CTkFrame):
+    """
+    Scrollable Table That Only Draws Visible Rows
+    
+    The table is given a list of rows (any objects) and a function that turns
+    one row into a line of text. Only the rows that fit on screen are turned
+    into text and drawn.
+    
+    Example:
+        table = VirtualTable(frame, format_row=lambda emp: emp['email'])
+        table.pack(fill="both", expand=True)
+        table.set_rows(employees)
+    """
+    
+    def __init__(self, parent, format_row, header="", empty_text="", height=300):
+        """
+        Initialize the table (empty until set_rows() is called).
+        
+        Args:
+            parent: Parent widget
+            format_row: Function that takes one row and returns its line of text
+            header: Text shown above the rows (column headings), optional
+            empty_text: Text shown when there are no rows, optional
+            height: Initial height of the row area in pixels
+        """
+        # Use the same background as a textbox so the table looks like one
+        super().__init__(parent, fg_color=ctk.ThemeManager.theme["CTkTextbox"]["fg_color"])
+        
+        # Function that formats one row (called only for visible rows)
+        self._format_row = format_row
+        
+        # Text shown when the table has no rows
+        self._empty_text = empty_text
+        
+        # All rows of the table (kept in Python, not in Tk)
+        self._rows = []
+        
+        # Index of the row shown at the top of the table
+        self._first = 0
+        
+        # Canvas text items, one per visible line (see _on_resize)
+        self._items = []
+        
+        # Width in pixels of the widest line drawn so far (header included)
+        # The canvas can be scrolled sideways over this width (see _fit_width)
+        self._text_width = 0
+        
+        # Monospace font, so the columns line up
+        # metrics("linespace") is the height of one line of text in pixels
+        self._font = get_font(10, family="Courier")
+        self._row_height = self._font.metrics("linespace")
+        
+        # Create the column headings on their own canvas (if any), so they
+        # scroll sideways together with the rows and the columns stay lined up
+        # The canvas is exactly as high as the header's lines
+        self._header_canvas = None
+        if header:
+            header_lines = header.split("\n")
+            self._header_canvas = tk.Canvas(
+                self,
+                height=len(header_lines) * self._row_height,
+                highlightthickness=0
+            )
+            self._header_canvas.pack(side="top", fill="x", padx=(10, 0), pady=(5, 0))
+            self._header_item = self._header_canvas.create_text(
+                4, 0, anchor="nw", text=header, font=self._font
+            )
+        
+        # Create the horizontal scrollbar (for rows wider than the table)
+        # It is packed before the rows canvas so it gets the bottom edge
+        # command=self.xview is called when the user drags or clicks it
+        self._xscrollbar = ctk.CTkScrollbar(self, orientation="horizontal", command=self.xview)
+        self._xscrollbar.pack(side="bottom", fill="x", padx=(10, 3), pady=(0, 3))
+        
+        # Create the scrollbar
+        # command=self.yview is called when the user drags or clicks it
+        self._scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self._scrollbar.pack(side="right", fill="y", padx=(0, 3), pady=3)
+        
+        # Create the canvas the rows are drawn on
+        # highlightthickness=0 removes the focus border
+        # xscrollcommand moves the horizontal scrollbar when the canvas
+        # scrolls sideways (the canvas does the sideways scrolling itself)
+        self._canvas = tk.Canvas(
+            self,
+            height=height,
+            highlightthickness=0,
+            xscrollcommand=self._xscrollbar.set
+        )
+        self._canvas.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=5)
+        
+        # Set canvas background and text color from the current theme
+        self._update_colors()
+        
+        # Let the canvas scroll sideways over the header's width
+        # (_redraw widens this when a wider row is drawn)
+        for line in header.split("\n"):
+            self._fit_width(line)
+        self._update_scrollregion()
+        
+        # Redraw when the table is resized (more or fewer rows fit)
+        self._canvas.bind("<Configure>", self._on_resize)
+        
+        # Scroll with the mouse wheel
+        self._canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self._canvas.bind("<Button-4>", self._on_mousewheel)
+        self._canvas.bind("<Button-5>", self._on_mousewheel)
+    
+    def set_rows(self, rows):
+        """
+        Show a new list of rows.
+        
+        The scroll position is kept (as far as the new list allows), so a
+        refresh doesn't jump back to the top.
+        
+        Args:
+            rows: List of rows; each row is passed to format_row when visible
+        """
+        self._rows = rows
+        self._redraw()
+    
+    def xview(self, *args):
+        """
+        Scroll the table sideways (called by the horizontal scrollbar).
+        
+        Args:
+            args: Same as yview(); passed on to the canvases, which scroll
+                  sideways themselves within their scrollregion
+        """
+        self._canvas.xview(*args)
+        if self._header_canvas is not None:
+            self._header_canvas.xview(*args)
+    
+    def yview(self, *args):
+        """
+        Scroll the table (called by the scrollbar).
+        
+        Args:
+            args: ("moveto", fraction) to jump to a position (0.0 = top,
+                  1.0 = bottom), or ("scroll", amount, "units"/"pages")
+                  to move by rows or by screens
+        """
+        if args[0] == "moveto":
+            # fraction of the whole list -> index of the top row
+            self._first = int(float(args[1]) * len(self._rows))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                # One page = the number of rows that fit on screen
+                step *= self._visible_rows()
+            self._first += step
+        self._redraw()
+    
+    def _visible_rows(self):
+        """
+        Get the number of whole rows that fit in the canvas.
+        
+        Returns:
+            int: Number of visible rows (at least 1)
+        """
+        return max(1, self._canvas.winfo_height() // self._row_height)
+    
+    def _on_resize(self, event):
+        """
+        Create or remove canvas text items so there is one per visible line.
+        
+        Args:
+            event: Configure event (event.height is the new canvas height)
+        """
+        # +1 for the row that is only partly visible at the bottom
+        needed = event.height // self._row_height + 1
+        
+        # Add text items for the new lines
+        # anchor="nw" places the text by its top-left corner
+        while len(self._items) < needed:
+            y = len(self._items) * self._row_height
+            self._items.append(self._canvas.create_text(
+                4, y, anchor="nw", font=self._font, fill=self._text_color
+            ))
+        
+        # Remove text items that no longer fit
+        while len(self._items) > needed:
+            self._canvas.delete(self._items.pop())
+        
+        # The scrollregion is as high as the canvas, so only sideways
+        # scrolling is left to the canvas
+        self._update_scrollregion()
+        self._redraw()
+    
+    def _on_mousewheel(self, event):
+        """
+        Scroll a few rows up or down with the mouse wheel.
+        
+        Args:
+            event: Mouse wheel event
+        
+        Returns:
+            str: "break" so the scrollable window around the table doesn't
+                 scroll as well
+        """
+        # event.num is 4 (up) or 5 (down) on Linux; elsewhere event.delta
+        # is positive when scrolling up
+        if event.num == 4 or event.delta > 0:
+            self._first -= _WHEEL_ROWS
+        else:
+            self._first += _WHEEL_ROWS
+        self._redraw()
+        return "break"
+    
+    def _redraw(self):
+        """
+        Put the text of the visible rows into the canvas text items.
+        
+        Only len(self._items) rows are formatted, however many rows there are.
+        """
+        rows = self._rows
+        total = len(rows)
+        visible = self._visible_rows()
+        
+        # Keep the top row in range (can't scroll past the last page)
+        # max(0, ...) handles lists shorter than one page
+        self._first = first = max(0, min(self._first, total - visible))
+        
+        format_row = self._format_row
+        for i, item in enumerate(self._items):
+            index = first + i
+            if index < total:
+                text = format_row(rows[index])
+            elif index == 0:
+                # No rows at all - show the empty text on the first line
+                text = self._empty_text
+            else:
+                text = ""
+            self._canvas.itemconfigure(item, text=text)
+            self._fit_width(text)
+        
+        # Move the scrollbar to match: it shows which part of the list is
+        # visible as two fractions (top and bottom, 0.0 to 1.0)
+        if total > visible:
+            self._scrollbar.set(first / total, (first + visible) / total)
+        else:
+            self._scrollbar.set(0.0, 1.0)
+    
+    def _fit_width(self, text):
+        """
+        Widen the sideways scrolling area if a line is wider than any before.
+        
+        Only lines that are drawn are measured (not every row), so the area
+        grows when a wider row (e.g. a long email) is scrolled into view.
+        
+        Args:
+            text: One line of text that is shown in the table
+        """
+        # measure() gives the width of the text in pixels with this font
+        # +8 leaves the same 4 pixel gap on the right as on the left
+        width = self._font.measure(text) + 8
+        if width > self._text_width:
+            self._text_width = width
+            self._update_scrollregion()
+    
+    def _update_scrollregion(self):
+        """
+        Let the canvases scroll sideways over the widest line drawn so far.
+        """
+        # scrollregion is (left, top, right, bottom) in pixels
+        # Top and bottom are the canvas's own edges, so it never scrolls up or down
+        region = (0, 0, self._text_width, self._canvas.winfo_height())
+        self._canvas.configure(scrollregion=region)
+        if self._header_canvas is not None:
+            self._header_canvas.configure(scrollregion=(0, 0, self._text_width, 0))
+    
+    def _update_colors(self):
+        """
+        Set the canvas background and text color for the current appearance
+        mode (light or dark).
+        """
+        # _apply_appearance_mode() picks the light or dark color from a theme color pair
+        theme = ctk.ThemeManager.theme["CTkTextbox"]
+        self._text_color = self._apply_appearance_mode(theme["text_color"])
+        background = self._apply_appearance_mode(theme["fg_color"])
+        self._canvas.configure(bg=background)
+        for item in self._items:
+            self._canvas.itemconfigure(item, fill=self._text_color)
+        if self._header_canvas is not None:
+            self._header_canvas.configure(bg=background)
+            self._header_canvas.itemconfigure(self._header_item, fill=self._text_color)
+    
+    def _set_appearance_mode(self, mode_string):
+        """
+        Update the colors when the appearance mode changes (called by CustomTkinter).
+        
+        Args:
+            mode_string: "light" or "dark"
+        """
+        super()._set_appearance_mode(mode_string)
+        self._update_colors()
@@ -22,6 +22,12 @@ import sys
 # Import os - provides operating system interface functions (like checking if files exist)
 import os
 
+# Import lru_cache - remembers the result of load_db_config() after the first call
+from functools import lru_cache
+
+# Import MappingProxyType - a read-only view of a dictionary (for the cached config)
+from types import MappingProxyType
+
 # Import DatabaseManager - this class handles all database connections and operations
 # It's like a "translator" between Python and MySQL database
 from database.db_manager import DatabaseManager
@@ -36,10 +42,13 @@ from auth.auth_manager import AuthManager
 # Import LoginWindow - the GUI window that shows the login screen
 from gui.login_window import LoginWindow
 
-# Import MainWindow - the main GUI window that appears after successful login
-from gui.main_window import MainWindow
+# NOTE: MainWindow (the main GUI window that appears after successful login)
+# is imported in on_login_success() instead of here. It is not needed until
+# the user has logged in, so the login window can appear without waiting
+# for it to load.
 
 
+@lru_cache(maxsize=1)
 def load_db_config():
     """
     Load MySQL database configuration from db_config.py file.
@@ -47,8 +56,12 @@ def load_db_config():
     This function reads the database connection settings (host, username, password, etc.)
     from a configuration file. This is safer than hardcoding credentials in the code.
     
+    The result is cached (@lru_cache), so calling this again returns the same
+    settings without checking for and reading db_config.py again.
+    
     Returns:
-        dict: A dictionary containing MySQL connection settings
+        MappingProxyType: Read-only dictionary containing MySQL connection settings
+        (read-only because the same cached object is returned to every caller)
         Exits the program if configuration file is missing or invalid
     """
     # Check if the db_config.py file exists in the current directory
@@ -65,7 +78,9 @@ def load_db_config():
             mysql_config = getattr(db_config, 'MYSQL_CONFIG', {})
             
             # Return the configuration dictionary so it can be used to connect to database
-            return mysql_config
+            # MappingProxyType wraps a copy of it in a read-only view, so no
+            # caller can change the cached settings for everyone else
+            return MappingProxyType(dict(mysql_config))
         except Exception:
             # If anything goes wrong (file corrupted, syntax error, etc.), just pass
             # and show error message below
@@ -181,6 +196,10 @@ class SmartRecordsApp:
         This method creates and shows the main application window with all features:
         employee management, department management, reports, etc.
         """
+        # Import MainWindow now that it is needed (see note at the top of the file)
+        # Python caches imported modules, so this only loads it once
+        from gui.main_window import MainWindow
+        
         # Create the main window with all the application features
         # Parameters:
         #   - self.root: The main window container
@@ -25,6 +25,158 @@ from datetime import datetime
 # Import os for file and directory operations
 import os
 
+# Import io for StringIO - collects the text written by write_report()
+import io
+
+# Import lru_cache - creates the PDF table styles only once (see _table_styles)
+from functools import lru_cache
+
+# Import the text report builder (shared with ReportWindow)
+# fetch_report_data() runs the report queries, write_report() writes the text
+from reports.report_text import DATE_FORMAT, fetch_report_data, get_current_date, write_report
+
+
+# Folder the exported reports are saved in
+_OUTPUT_DIR = "reports_output"
+
+# Format of the timestamp in export filenames
+# "%Y%m%d_%H%M%S" format: YearMonthDay_HourMinuteSecond
+# Example: "20240115_143022" (January 15, 2024 at 14:30:22)
+_FILENAME_TIME_FORMAT = "%Y%m%d_%H%M%S"
+
+# Largest number of employees listed in the PDF export
+_PDF_EMPLOYEE_LIMIT = 50
+
+
+def _file_prefix(include_employees):
+    """
+    Get the start of an export's filename.
+    
+    Args:
+        include_employees (bool): False for a summary-only report
+    
+    Returns:
+        str: "report" for a full report, "summary" for a summary-only report
+    """
+    return "report" if include_employees else "summary"
+
+
+def _create_export_file(prefix, now, extension, mode, encoding=None):
+    """
+    Create a new, empty export file and open it for writing.
+    
+    The filename is made from the prefix and the export time, e.g.
+    "report_20240115_143022.txt". Two exports can start within the same
+    second (e.g. one from the Reports menu and one from the report window),
+    so the file is opened in "x" (exclusive create) mode: if the name is
+    already taken, opening fails instead of overwriting the other file, and
+    a counter is added to the name ("report_20240115_143022_2.txt").
+    
+    Args:
+        prefix (str): Start of the filename ("report" or "summary")
+        now (datetime): Export time used in the filename
+        extension (str): File extension without the dot ("txt" or "pdf")
+        mode (str): "x" for a text file, "xb" for a binary file
+        encoding (str, optional): Text encoding (text files only)
+    
+    Returns:
+        tuple: (file path, open file object) - the file belongs to this
+               export only, so it can safely be removed if the export fails
+    """
+    # Create output directory if it doesn't exist
+    # os.makedirs() creates directory (and parent directories if needed)
+    # exist_ok=True means "no error if it already exists" - one call
+    # instead of checking with os.path.exists() first (and no error if
+    # another export creates it between the check and the makedirs)
+    os.makedirs(_OUTPUT_DIR, exist_ok=True)
+    
+    # strftime() formats the time as string (see _FILENAME_TIME_FORMAT)
+    # Example: "report_20240115_143022"
+    base = f"{prefix}_{now.strftime(_FILENAME_TIME_FORMAT)}"
+    
+    counter = 1
+    name = base
+    while True:
+        # os.path.join() combines directory and filename (handles OS differences)
+        # Windows: "reports_output\\report_20240115_143022.txt"
+        # Linux/Mac: "reports_output/report_20240115_143022.txt"
+        filepath = os.path.join(_OUTPUT_DIR, f"{name}.{extension}")
+        try:
+            return filepath, open(filepath, mode, encoding=encoding)
+        except FileExistsError:
+            # Another export already has this name - try the next number
+            counter += 1
+            name = f"{base}_{counter}"
+
+
+@lru_cache(maxsize=1)
+def _table_styles():
+    """
+    Create the table styles used by the PDF export.
+    
+    The styles are the same for every export, so they are created on the
+    first call and the same objects are returned afterwards. (They can't be
+    created at import time because reportlab is optional - it is only
+    imported when a PDF is exported.)
+    
+    Returns:
+        tuple: (summary_style, employee_style)
+               summary_style is used by the summary and department tables,
+               employee_style by the employee listing
+    """
+    from reportlab.lib import colors  # type: ignore
+    from reportlab.platypus import TableStyle  # type: ignore
+    
+    # TableStyle() creates styling rules for table
+    # Rules are applied in order
+    summary_style = TableStyle([
+        # Style header row (row 0)
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Gray background
+        # (0, 0) means column 0, row 0 (top-left)
+        # (-1, 0) means last column, row 0 (top-right)
+        # This styles the entire header row
+        
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),  # White text
+        
+        # Style all cells
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),  # Left-align all cells
+        # (-1, -1) means last column, last row (bottom-right)
+        
+        # Style header row font
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Bold font
+        ('FONTSIZE', (0, 0), (-1, 0), 12),  # 12pt font
+        
+        # Add padding to header
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # 12 points padding
+        
+        # Style data rows (row 1 onwards)
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),  # Beige background
+        
+        # Add grid lines
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)  # Black grid lines, 1pt width
+    ])
+    
+    employee_style = TableStyle([
+        # Header row styling
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),  # Smaller font for header (9pt)
+        
+        # Data row styling
+        ('FONTSIZE', (0, 1), (-1, -1), 8),  # Even smaller for data (8pt)
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        
+        # Alternating row colors
+        # ROWBACKGROUNDS alternates between white and light gray
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
+    ])
+    
+    return summary_style, employee_style
+
 
 class ReportGenerator:
     """
@@ -59,12 +211,10 @@ class ReportGenerator:
         Returns:
             str: Formatted date/time string (e.g., "2024-01-15 14:30:22")
         """
-        # datetime.now() gets current date and time
-        # strftime() formats it as a string
-        # "%Y-%m-%d %H:%M:%S" format: Year-Month-Day Hour:Minute:Second
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Same format as the timestamp in the text report
+        return get_current_date()
     
-    def generate_report_text(self):
+    def generate_report_text(self, now=None):
         """
         Generate formatted text report.
         
@@ -74,245 +224,93 @@ class ReportGenerator:
         - Employee listing (table format)
         - Department listing (table format)
         
+        Args:
+            now (datetime, optional): Time shown in the report footer.
+                                      None uses the current time.
+        
         Returns:
             str: Complete report as formatted text string
         """
-        # Get data from database
-        # get_statistics() returns dict with employee statistics
-        stats = self.employee_model.get_statistics()
-        
-        # get_all() returns list of all employees
-        employees = self.employee_model.get_all()
-        
-        # get_all() returns list of all departments
-        departments = self.department_model.get_all()
-        
-        # ========== BUILD REPORT HEADER ==========
-        # Start building report string
-        # "=" * 80 creates a line of 80 equal signs (decorative separator)
-        report = "=" * 80 + "\n"
-        
-        # Add report title (centered)
-        # " " * 25 adds 25 spaces before title (centers it approximately)
-        report += " " * 25 + "SMART RECORDS SYSTEM REPORT\n"
-        report += "=" * 80 + "\n\n"
-        
-        # ========== SUMMARY STATISTICS SECTION ==========
-        report += "SUMMARY STATISTICS\n"
-        report += "-" * 80 + "\n"  # Separator line (80 dashes)
-        
-        # Add total employees count
-        # .get() safely gets value from dict, uses 0 as default if not found
-        report += f"Total Employees: {stats.get('total_employees', 0)}\n"
-        
-        # Add total departments count
-        # len() gets number of items in list
-        report += f"Total Departments: {len(departments)}\n"
-        
-        # Add salary statistics (only if there are employees)
-        # This prevents division by zero errors
-        if stats.get('total_employees', 0) > 0:
-            # Get salary values (use 0 as default if None)
-            # The "or 0" handles None values (None or 0 evaluates to 0)
-            avg_salary = stats.get('avg_salary', 0) or 0
-            min_salary = stats.get('min_salary', 0) or 0
-            max_salary = stats.get('max_salary', 0) or 0
-            total_salary = stats.get('total_salary', 0) or 0
-            
-            # Format salary with currency symbol and commas
-            # :,.2f formats number with:
-            #   - Commas as thousand separators (50,000)
-            #   - 2 decimal places (.00)
-            # Example: 50000 becomes "50,000.00"
-            report += f"Average Salary: ${avg_salary:,.2f}\n"
-            report += f"Minimum Salary: ${min_salary:,.2f}\n"
-            report += f"Maximum Salary: ${max_salary:,.2f}\n"
-            report += f"Total Salary Budget: ${total_salary:,.2f}\n"
-        
-        # Add separator between sections
-        report += "\n" + "=" * 80 + "\n\n"
-        
-        # ========== DEPARTMENT-WISE EMPLOYEE COUNT SECTION ==========
-        report += "DEPARTMENT-WISE EMPLOYEE COUNT\n"
-        report += "-" * 80 + "\n"
-        
-        # Count employees per department
-        # Create dictionary to store counts
-        # Key: department name, Value: employee count
-        dept_employee_count = {}
-        
-        # Loop through all employees
-        for emp in employees:
-            # Get department name (or "No Department" if None)
-            # .get() safely gets value, uses default if not found
-            dept_name = emp.get('department_name', 'No Department')
-            
-            # Increment count for this department
-            # .get(dept_name, 0) gets current count (0 if department not in dict yet)
-            # Then add 1 to increment
-            dept_employee_count[dept_name] = dept_employee_count.get(dept_name, 0) + 1
-        
-        # Add department counts to report (sorted alphabetically)
-        # sorted() sorts dictionary items by key (department name)
-        # .items() returns (key, value) pairs
-        for dept_name, count in sorted(dept_employee_count.items()):
-            report += f"{dept_name}: {count} employee(s)\n"
-        
-        # Add separator
-        report += "\n" + "=" * 80 + "\n\n"
-        
-        # ========== EMPLOYEE LISTING SECTION ==========
-        report += "EMPLOYEE LISTING\n"
-        report += "-" * 80 + "\n"
-        
-        # Check if there are employees
-        if employees:
-            # Create table header
-            # Format: column names with spacing for alignment
-            # <5 means left-align, width 5 characters
-            # <25 means left-align, width 25 characters
-            # This creates aligned columns
-            report += f"{'ID':<5} {'Name':<25} {'Email':<25} {'Position':<15} {'Salary':<12} {'Department':<15}\n"
-            report += "-" * 80 + "\n"  # Separator line under header
-            
-            # Add each employee as a row
-            for emp in employees:
-                try:
-                    # Extract and format employee data
-                    # Combine first and last name
-                    name = f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip()
-                    
-                    # Get email (use "N/A" if not found)
-                    email = emp.get('email', 'N/A')
-                    
-                    # Get position (use "N/A" if None or empty)
-                    # "or" operator: if position is None/empty, use "N/A"
-                    position = emp.get('position') or "N/A"
-                    
-                    # Format salary with currency symbol
-                    salary_val = emp.get('salary')
-                    # If salary exists and is not 0, format it; otherwise show "N/A"
-                    # f"${salary_val:.2f}" formats as currency with 2 decimals
-                    salary = f"${salary_val:.2f}" if salary_val is not None and salary_val != 0 else "N/A"
-                    
-                    # Get department name
-                    dept = emp.get('department_name', 'N/A')
-                    
-                    # Get employee ID
-                    emp_id = emp.get('id', 'N/A')
-                    
-                    # Add employee row to report
-                    # Format aligns columns using spacing (<5, <25, etc.)
-                    report += f"{emp_id:<5} {name:<25} {email:<25} {position:<15} {salary:<12} {dept:<15}\n"
-                except Exception:
-                    # Skip this employee if error occurs (prevents crash)
-                    # This handles corrupted data gracefully
-                    continue
-        else:
-            # No employees found
-            report += "No employees found.\n"
-        
-        # Add separator
-        report += "\n" + "=" * 80 + "\n\n"
-        
-        # ========== DEPARTMENT LISTING SECTION ==========
-        report += "DEPARTMENT LISTING\n"
-        report += "-" * 80 + "\n"
-        
-        # Check if there are departments
-        if departments:
-            # Create table header
-            report += f"{'ID':<5} {'Name':<30} {'Description':<40}\n"
-            report += "-" * 80 + "\n"
-            
-            # Add each department as a row
-            for dept in departments:
-                try:
-                    # Extract department data
-                    name = dept.get('name', 'N/A')
-                    
-                    # Get description (limit to 40 characters for table alignment)
-                    # [:40] slices string to first 40 characters
-                    # This prevents long descriptions from breaking table layout
-                    desc = (dept.get('description') or "N/A")[:40]
-                    
-                    # Get department ID
-                    dept_id = dept.get('id', 'N/A')
-                    
-                    # Add department row to report
-                    report += f"{dept_id:<5} {name:<30} {desc:<40}\n"
-                except Exception:
-                    # Skip this department if error occurs
-                    continue
-        else:
-            # No departments found
-            report += "No departments found.\n"
-        
-        # ========== REPORT FOOTER ==========
-        report += "\n" + "=" * 80 + "\n"
-        
-        # Add generation timestamp
-        # get_current_date() returns formatted date/time string
-        report += f"Report generated on: {self.get_current_date()}\n"
-        report += "=" * 80 + "\n"
-        
-        # Return complete report string
-        return report
+        # The text is built by write_report() (reports/report_text.py), the
+        # same code ReportWindow uses, so the screen and the file match
+        # StringIO collects the written pieces; getvalue() returns them as one string
+        out = io.StringIO()
+        generated_on = now.strftime(DATE_FORMAT) if now is not None else None
+        write_report(
+            out,
+            fetch_report_data(self.employee_model, self.department_model),
+            generated_on=generated_on
+        )
+        return out.getvalue()
     
-    def export_to_txt(self) -> str:
+    def export_to_txt(self, include_employees=True) -> str:
         """
         Export report to text file.
         
         This method:
         1. Generates timestamp for unique filename
         2. Creates reports_output directory if it doesn't exist
-        3. Writes report text to file
+        3. Writes report text to file (piece by piece, see write_report)
         4. Returns file path
         
+        Args:
+            include_employees (bool): False for a summary-only report - the
+                                      employees are not queried and the
+                                      employee listing is left out (the
+                                      file is named summary_... instead
+                                      of report_...)
+        
         Returns:
             str: Path to exported text file
             
         Example:
             Returns: "reports_output/report_20240115_143022.txt"
         """
-        # Generate timestamp for filename
-        # strftime() formats datetime as string
-        # "%Y%m%d_%H%M%S" format: YearMonthDay_HourMinuteSecond
-        # Example: "20240115_143022" (January 15, 2024 at 14:30:22)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create filename with timestamp
-        # f"report_{timestamp}.txt" creates: "report_20240115_143022.txt"
-        filename = f"report_{timestamp}.txt"
-        
-        # Set output directory name
-        output_dir = "reports_output"
-        
-        # Create directory if it doesn't exist
-        # os.path.exists() checks if directory exists
-        if not os.path.exists(output_dir):
-            # os.makedirs() creates directory (and parent directories if needed)
-            os.makedirs(output_dir)
-        
-        # Create full file path
-        # os.path.join() combines directory and filename (handles OS differences)
-        # Windows: "reports_output\\report_20240115_143022.txt"
-        # Linux/Mac: "reports_output/report_20240115_143022.txt"
-        filepath = os.path.join(output_dir, filename)
+        # Get the export time once and use it for both the filename and
+        # the footer, so they always show the same time
+        now = datetime.now()
         
-        # Write report to file
-        # "with open()" automatically closes file when done (even if error occurs)
-        # 'w' mode opens file for writing (overwrites if exists)
+        # Get data from database
+        # stream_employees=True loads the employees a chunk at a time while
+        # they are written, so the export never holds all of them in memory
+        data = fetch_report_data(
+            self.employee_model,
+            self.department_model,
+            stream_employees=True,
+            include_employees=include_employees
+        )
+        
+        # Create the file with a unique name
+        # e.g. "reports_output/report_20240115_143022.txt"
+        # (summary-only reports are named "summary_20240115_143022.txt")
         # encoding='utf-8' ensures proper character encoding (handles special characters)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            # Write report text to file
-            # generate_report_text() returns formatted report string
-            f.write(self.generate_report_text())
+        filepath, f = _create_export_file(_file_prefix(include_employees), now, "txt", "x", encoding='utf-8')
+        
+        # Write report to file
+        # "with f:" automatically closes file when done (even if error occurs)
+        with f:
+            # write_report() writes each section and row straight to the file,
+            # so the whole report is never held in memory as one string
+            try:
+                write_report(
+                    f,
+                    data,
+                    include_employees=include_employees,
+                    generated_on=now.strftime(DATE_FORMAT)
+                )
+            except Exception:
+                # The employees are queried while writing, so a database
+                # error can stop the export halfway - don't leave a
+                # half-written file behind (the file was created by this
+                # export, so no other export's file is removed)
+                f.close()
+                os.remove(filepath)
+                raise
         
         # Return file path so caller knows where file was saved
         return filepath
     
-    def export_to_pdf(self):
+    def export_to_pdf(self, include_employees=True):
         """
         Export report to PDF file.
         
@@ -322,6 +320,11 @@ class ReportGenerator:
         - Headers and sections
         - Professional layout
         
+        Args:
+            include_employees (bool): False for a summary-only report - the
+                                      employees are not queried and the
+                                      employee listing is left out
+        
         Returns:
             str: Path to exported PDF file
             
@@ -335,9 +338,6 @@ class ReportGenerator:
             # letter: Standard US letter page size (8.5 x 11 inches)
             from reportlab.lib.pagesizes import letter  # type: ignore
             
-            # colors: Color definitions for styling
-            from reportlab.lib import colors  # type: ignore
-            
             # Styles: Pre-defined text styles and custom style creation
             from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # type: ignore
             
@@ -346,8 +346,8 @@ class ReportGenerator:
             # Paragraph: Formatted text paragraphs
             # Spacer: Empty space
             # Table: Data tables
-            # TableStyle: Table styling
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle  # type: ignore
+            # (colors and TableStyle are imported by _table_styles())
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table  # type: ignore
             
             # inch: Unit conversion (1 inch = 72 points)
             from reportlab.lib.units import inch  # type: ignore
@@ -358,26 +358,8 @@ class ReportGenerator:
                 "Install it using: pip install reportlab"
             )
         
-        # Generate timestamp for filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create PDF filename
-        filename = f"report_{timestamp}.pdf"
-        
-        # Set output directory
-        output_dir = "reports_output"
-        
-        # Create directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        # Create full file path
-        filepath = os.path.join(output_dir, filename)
-        
-        # Create PDF document template
-        # SimpleDocTemplate creates a PDF document
-        # pagesize=letter sets page size to US letter (8.5 x 11 inches)
-        doc = SimpleDocTemplate(filepath, pagesize=letter)
+        # Get the export time once (used for the filename and the footer)
+        now = datetime.now()
         
         # Create story list (contains all PDF elements)
         # "Story" is ReportLab's term for a list of elements to add to PDF
@@ -423,8 +405,11 @@ class ReportGenerator:
         story.append(Spacer(1, 0.2 * inch))
         
         # Get data from database
+        # Only the first _PDF_EMPLOYEE_LIMIT employees are listed in the PDF,
+        # so only those are fetched (the total comes from the statistics)
         stats = self.employee_model.get_statistics()
-        employees = self.employee_model.get_all()
+        employees = self.employee_model.get_all_for_report(limit=_PDF_EMPLOYEE_LIMIT) if include_employees else []
+        total_employees = stats.get('total_employees', 0)
         departments = self.department_model.get_all()
         
         # ========== SUMMARY STATISTICS TABLE ==========
@@ -461,34 +446,10 @@ class ReportGenerator:
         summary_table = Table(summary_data, colWidths=[3 * inch, 3 * inch])
         
         # Apply table styling
-        # TableStyle() creates styling rules for table
-        # Rules are applied in order
-        summary_table.setStyle(TableStyle([
-            # Style header row (row 0)
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),  # Gray background
-            # (0, 0) means column 0, row 0 (top-left)
-            # (-1, 0) means last column, row 0 (top-right)
-            # This styles the entire header row
-            
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),  # White text
-            
-            # Style all cells
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),  # Left-align all cells
-            # (-1, -1) means last column, last row (bottom-right)
-            
-            # Style header row font
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Bold font
-            ('FONTSIZE', (0, 0), (-1, 0), 12),  # 12pt font
-            
-            # Add padding to header
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),  # 12 points padding
-            
-            # Style data rows (row 1 onwards)
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),  # Beige background
-            
-            # Add grid lines
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)  # Black grid lines, 1pt width
-        ]))
+        # The styles never change, so they are created once (see _table_styles)
+        # and shared by all tables and all exports
+        summary_style, employee_style = _table_styles()
+        summary_table.setStyle(summary_style)
         
         # Add table to PDF story
         story.append(summary_table)
@@ -499,47 +460,36 @@ class ReportGenerator:
         # ========== DEPARTMENT-WISE EMPLOYEE COUNT TABLE ==========
         story.append(Paragraph("Department-wise Employee Count", heading_style))
         
-        # Count employees per department
-        dept_employee_count = {}
-        for emp in employees:
-            dept_name = emp.get('department_name', 'No Department')
-            dept_employee_count[dept_name] = dept_employee_count.get(dept_name, 0) + 1
-        
         # Create table data
+        # The database counts the employees per department and already
+        # returns them sorted by name (ORDER BY), so no counting or sorting
+        # is needed here (see count_by_department)
         dept_data = [['Department', 'Employee Count']]  # Header row
-        for dept_name, count in sorted(dept_employee_count.items()):
+        for dept_name, count in self.employee_model.count_by_department():
             dept_data.append([dept_name, str(count)])  # Data rows
         
         # Create table
         dept_table = Table(dept_data, colWidths=[4 * inch, 2 * inch])
         
         # Apply same styling as summary table
-        dept_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        dept_table.setStyle(summary_style)
         
         story.append(dept_table)
         story.append(Spacer(1, 0.3 * inch))
         
         # ========== EMPLOYEE LISTING TABLE ==========
-        story.append(Paragraph("Employee Listing", heading_style))
-        
-        if employees:
-            # Create table data
-            emp_data = [['ID', 'Name', 'Email', 'Position', 'Salary', 'Department']]  # Header
+        # (left out of summary-only reports - see include_employees)
+        if include_employees:
+            story.append(Paragraph("Employee Listing", heading_style))
             
-            # Limit to 50 employees per PDF to avoid memory issues
-            # [:50] slices list to first 50 items
-            # Large tables can cause memory problems in PDF generation
-            for emp in employees[:50]:
-                try:
+            if employees:
+                # Create table data
+                emp_data = [['ID', 'Name', 'Email', 'Position', 'Salary', 'Department']]  # Header
+                
+                # Limit to 50 employees per PDF to avoid memory issues
+                # (employees only holds the first 50 - see get_all_for_report(limit=...) above)
+                # Large tables can cause memory problems in PDF generation
+                for emp in employees:
                     # Extract and format employee data
                     name = f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip()
                     email = emp.get('email', 'N/A')
@@ -549,65 +499,65 @@ class ReportGenerator:
                     salary_val = emp.get('salary')
                     salary = f"${salary_val:.2f}" if salary_val is not None and salary_val != 0 else "N/A"
                     
-                    dept = emp.get('department_name', 'N/A')
+                    dept = emp.get('department_name') or 'N/A'
                     emp_id = str(emp.get('id', 'N/A'))
                     
                     # Add employee row
                     emp_data.append([emp_id, name, email, position, salary, dept])
-                except Exception:
-                    continue
-            
-            # If more than 50 employees, add note
-            if len(employees) > 50:
-                # Add row indicating more employees exist
-                emp_data.append(['...', f'... and {len(employees) - 50} more employees', '', '', '', ''])
-            
-            # Create table with specific column widths
-            # Column widths in inches: ID, Name, Email, Position, Salary, Department
-            emp_table = Table(
-                emp_data, 
-                colWidths=[0.5 * inch, 1.5 * inch, 1.8 * inch, 1.2 * inch, 1 * inch, 1 * inch]
-            )
-            
-            # Apply table styling
-            emp_table.setStyle(TableStyle([
-                # Header row styling
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 9),  # Smaller font for header (9pt)
                 
-                # Data row styling
-                ('FONTSIZE', (0, 1), (-1, -1), 8),  # Even smaller for data (8pt)
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                # If more than 50 employees, add note
+                if total_employees > _PDF_EMPLOYEE_LIMIT:
+                    # Add row indicating more employees exist
+                    emp_data.append(['...', f'... and {total_employees - _PDF_EMPLOYEE_LIMIT} more employees', '', '', '', ''])
+                
+                # Create table with specific column widths
+                # Column widths in inches: ID, Name, Email, Position, Salary, Department
+                emp_table = Table(
+                    emp_data, 
+                    colWidths=[0.5 * inch, 1.5 * inch, 1.8 * inch, 1.2 * inch, 1 * inch, 1 * inch]
+                )
                 
-                # Alternating row colors
-                # ROWBACKGROUNDS alternates between white and light gray
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-            ]))
+                # Apply table styling (smaller fonts, alternating row colors)
+                emp_table.setStyle(employee_style)
+                
+                story.append(emp_table)
+            else:
+                # No employees - add message
+                story.append(Paragraph("No employees found.", styles['Normal']))
+            
+            # Add spacer
+            story.append(Spacer(1, 0.3 * inch))
             
-            story.append(emp_table)
-        else:
-            # No employees - add message
-            story.append(Paragraph("No employees found.", styles['Normal']))
-        
-        # Add spacer
-        story.append(Spacer(1, 0.3 * inch))
-        
         # ========== REPORT FOOTER ==========
         # Add more spacer
         story.append(Spacer(1, 0.2 * inch))
         
         # Add generation timestamp
-        story.append(Paragraph(f"Report generated on: {self.get_current_date()}", styles['Normal']))
-        
-        # Build PDF document
-        # build() takes the story list and creates the PDF file
-        # This writes all elements to the file
-        doc.build(story)
+        story.append(Paragraph(f"Report generated on: {now.strftime(DATE_FORMAT)}", styles['Normal']))
+        
+        # Create the file with a unique name (summary_... for summary-only
+        # reports) - only now, after all the queries, so a failed query
+        # doesn't leave an empty file behind
+        # "xb" = create a new binary file (a PDF is binary data)
+        filepath, f = _create_export_file(_file_prefix(include_employees), now, "pdf", "xb")
+        
+        with f:
+            try:
+                # Create PDF document template
+                # SimpleDocTemplate creates a PDF document; it writes into
+                # the file object we give it
+                # pagesize=letter sets page size to US letter (8.5 x 11 inches)
+                doc = SimpleDocTemplate(f, pagesize=letter)
+                
+                # Build PDF document
+                # build() takes the story list and creates the PDF file
+                # This writes all elements to the file
+                doc.build(story)
+            except Exception:
+                # Don't leave a broken PDF behind
+                f.close()
+                os.remove(filepath)
+                raise
         
         # Return file path
         return filepath
@@ -0,0 +1,300 @@
+"""
+Text Report Builder - Smart Records System
+
+This module builds the plain-text report. It is used by:
+- ReportWindow (gui/report_window.py) to show the report on screen
+- ReportGenerator.export_to_txt() to write the report to a .txt file
+
+The report is written piece by piece to an "output" object with a write()
+method. For the screen this is an io.StringIO (text kept in memory); for the
+TXT export it is the open file itself, so the report goes straight to disk
+and is never held in memory as one big string.
+
+CONCEPTS EXPLAINED:
+- File-like object: Anything with a write() method (open files, io.StringIO)
+- io.StringIO: A "file" that keeps the written text in memory
+- Format templates: Strings like "{id:<5}" that line up table columns
+"""
+
+# Import time for the "Report generated on" timestamp
+import time
+
+
+# Fixed pieces of the report text
+# They never change, so they are built once when the module is imported
+# instead of every time the report is generated
+# "=" * 80 creates a line of 80 equal signs (decorative separator)
+_SEPARATOR_LINE = "=" * 80 + "\n"
+_DIVIDER_LINE = "-" * 80 + "\n"
+
+# Report title block - " " * 25 adds 25 spaces before the title (centers it)
+_REPORT_HEADER = _SEPARATOR_LINE + " " * 25 + "SMART RECORDS SYSTEM REPORT\n" + _SEPARATOR_LINE + "\n"
+
+# Separator between sections
+_SECTION_BREAK = "\n" + _SEPARATOR_LINE + "\n"
+
+# Section titles, each followed by its divider line
+# The report header and the summary title are always written together,
+# so they are joined into one piece
+_SUMMARY_TITLE = _REPORT_HEADER + "SUMMARY STATISTICS\n" + _DIVIDER_LINE
+_DEPT_COUNT_TITLE = _SECTION_BREAK + "DEPARTMENT-WISE EMPLOYEE COUNT\n" + _DIVIDER_LINE
+_EMPLOYEE_TITLE = _SECTION_BREAK + "EMPLOYEE LISTING\n" + _DIVIDER_LINE
+_DEPARTMENT_TITLE = _SECTION_BREAK + "DEPARTMENT LISTING\n" + _DIVIDER_LINE
+
+# Start of the footer (the timestamp line follows it)
+_FOOTER_START = "\n" + _SEPARATOR_LINE + "Report generated on: "
+
+# Column headings of the listing tables (followed by a divider line)
+# EMPLOYEE_TABLE_HEADER is also used by ReportWindow's employee table
+EMPLOYEE_TABLE_HEADER = (
+    f"{'ID':<5} {'Name':<25} {'Email':<25} {'Position':<15} {'Salary':<12} {'Department':<15}\n"
+    + _DIVIDER_LINE
+)
+_DEPARTMENT_TABLE_HEADER = f"{'ID':<5} {'Name':<30} {'Description':<40}\n" + _DIVIDER_LINE
+
+# Row templates for the employee and department listings
+# They are created once here instead of building an f-string per row
+# <5 means left-align, width 5 characters
+# <25 means left-align, width 25 characters
+# The fields are filled in by position (not by name): passing positional
+# arguments to format() is about twice as fast as keyword arguments, which
+# Python first has to collect into a dictionary
+# Employee fields: id, name, email, position, salary, department
+# (employee rows don't end with "\n" - ReportWindow's employee table draws
+# them one per line; write_report() adds the "\n")
+_EMPLOYEE_ROW_FORMAT = "{:<5} {:<25} {:<25} {:<15} {:<12} {:<15}"
+# Department fields: id, name, description
+_DEPARTMENT_ROW_FORMAT = "{:<5} {:<30} {:<40}\n"
+
+
+# Format of the "Report generated on" timestamp
+# "%Y-%m-%d %H:%M:%S" format: Year-Month-Day Hour:Minute:Second
+# (also used by ReportGenerator, which formats the export time itself)
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Last timestamp made by get_current_date(), as (second, text)
+# The text only changes once per second, so it is reused within the same second
+_last_date = (None, "")
+
+
+def get_current_date():
+    """
+    Get current date and time as formatted string.
+    
+    The string is only formatted again when the second changes; calls within
+    the same second return the string made last time.
+    
+    Returns:
+        str: Formatted date/time string (e.g., "2024-01-15 14:30:22")
+    """
+    global _last_date
+    
+    # time.time() is the current time in seconds; int() drops the fraction
+    second = int(time.time())
+    if _last_date[0] != second:
+        # localtime() converts the seconds to local date/time parts
+        # strftime() formats them as a string (see DATE_FORMAT)
+        # (one tuple assignment, so another thread never sees half an update)
+        _last_date = (second, time.strftime(DATE_FORMAT, time.localtime(second)))
+    return _last_date[1]
+
+
+def fetch_report_data(employee_model, department_model, stream_employees=False, include_employees=True):
+    """
+    Query the database for the report data.
+    
+    This function does not touch any widgets, so it is safe to call from a
+    background thread.
+    
+    Args:
+        employee_model: EmployeeModel instance
+        department_model: DepartmentModel instance
+        stream_employees: If True, 'employees' is an iterator that loads the
+                          employees a chunk at a time while the report is
+                          written (see EmployeeModel.iter_all) instead of a
+                          list. It can only be gone through once.
+        include_employees: False to skip the employee query ('employees'
+                           is then an empty list) - for reports without
+                           the employee listing
+    
+    Returns:
+        dict: {'stats': dict, 'employees': list, 'dept_counts': list,
+               'departments': list}
+    """
+    # Get all employees from database (only the columns the report shows)
+    # get_all_for_report() returns list of employee dictionaries
+    # iter_all() returns them a chunk at a time (nothing is queried yet)
+    if not include_employees:
+        employees = []
+    elif stream_employees:
+        employees = employee_model.iter_all()
+    else:
+        employees = employee_model.get_all_for_report()
+    
+    return {
+        # Get employee statistics from database
+        # get_statistics() returns dict with: total_employees, avg_salary, min_salary, max_salary, total_salary
+        'stats': employee_model.get_statistics(),
+        
+        'employees': employees,
+        
+        # Get number of employees per department (counted by the database)
+        # count_by_department() returns list of (department name, count) tuples
+        'dept_counts': employee_model.count_by_department(),
+        
+        # Get all departments from database
+        # get_all() returns list of department dictionaries
+        'departments': department_model.get_all(),
+    }
+
+
+def format_employee_row(emp):
+    """
+    Format one employee as a line of the employee listing (without "\\n").
+    
+    Rows come from get_all_for_report() or iter_all(), which select every
+    column used here, so emp['...'] can be used instead of the slower
+    emp.get(...)
+    
+    Args:
+        emp: Employee dictionary
+    
+    Returns:
+        str: Employee row text (columns aligned with EMPLOYEE_TABLE_HEADER)
+    """
+    salary_val = emp['salary']
+    # Arguments are in the order of the template's columns
+    return _EMPLOYEE_ROW_FORMAT.format(
+        emp['id'],
+        # Combine first and last name
+        f"{emp['first_name']} {emp['last_name']}".strip(),
+        emp['email'],
+        # Use "N/A" if position is None or empty
+        emp['position'] or "N/A",
+        # If salary exists and is not 0, format it with currency
+        # symbol; otherwise show "N/A"
+        f"${salary_val:.2f}" if salary_val else "N/A",
+        # department_name is None for employees without a department
+        emp['department_name'] or "N/A"
+    )
+
+
+def write_report(out, data, include_employees=True, generated_on=None):
+    """
+    Write the text report to out, one piece at a time.
+    
+    The report is never built as one big string: every section and row is
+    written as soon as it is formatted.
+    
+    Args:
+        out: Where to write the text - an open text file or an io.StringIO
+        data: Report data dict returned by fetch_report_data()
+              ('employees' may be a list or an iterator)
+        include_employees: False to leave out the employee listing
+                           (ReportWindow shows it in a separate table)
+        generated_on: Timestamp text for the footer (formatted with
+                      DATE_FORMAT). None uses the current time.
+    
+    Example:
+        with open("report.txt", "w", encoding="utf-8") as f:
+            write_report(f, fetch_report_data(employee_model, department_model))
+    """
+    # Unpack the data loaded by fetch_report_data()
+    stats = data['stats']
+    employees = data['employees']
+    departments = data['departments']
+    
+    # write is a shortcut to out.write (saves a lookup in the loops)
+    write = out.write
+    
+    # Start the report with the title block (centered title)
+    # ========== SUMMARY STATISTICS SECTION ==========
+    write(_SUMMARY_TITLE)
+    
+    # Add total employees count
+    # .get() safely gets value, uses 0 as default if not found
+    write(f"Total Employees: {stats.get('total_employees', 0)}\n")
+    
+    # Add total departments count
+    # len() gets number of items in list
+    write(f"Total Departments: {len(departments)}\n")
+    
+    # Add salary statistics (only if there are employees)
+    if stats.get('total_employees', 0) > 0:
+        # Get salary values (use 0 as default if None)
+        avg_salary = stats.get('avg_salary', 0) or 0
+        min_salary = stats.get('min_salary', 0) or 0
+        max_salary = stats.get('max_salary', 0) or 0
+        total_salary = stats.get('total_salary', 0) or 0
+        
+        # Format salary with currency symbol and commas
+        # :,.2f formats number with commas and 2 decimal places
+        # Example: 50000 becomes "50,000.00"
+        write(f"Average Salary: ${avg_salary:,.2f}\n")
+        write(f"Minimum Salary: ${min_salary:,.2f}\n")
+        write(f"Maximum Salary: ${max_salary:,.2f}\n")
+        write(f"Total Salary Budget: ${total_salary:,.2f}\n")
+    
+    # ========== DEPARTMENT-WISE EMPLOYEE COUNT SECTION ==========
+    # (the title starts with the separator after the previous section)
+    write(_DEPT_COUNT_TITLE)
+    
+    # Add department counts to report
+    # The database already counted and sorted them (see count_by_department)
+    for dept_name, count in data['dept_counts']:
+        write(f"{dept_name}: {count} employee(s)\n")
+    
+    # ========== EMPLOYEE LISTING SECTION ==========
+    if include_employees:
+        write(_EMPLOYEE_TITLE)
+        
+        # Get the first employee to check if there are any
+        # iter() works for both a list and an iterator (streamed employees),
+        # next(..., None) returns None if there are no employees
+        employees = iter(employees)
+        first_emp = next(employees, None)
+        
+        if first_emp is not None:
+            # Create table header (column names and separator line)
+            write(EMPLOYEE_TABLE_HEADER)
+            write(format_employee_row(first_emp) + "\n")
+            
+            # Add each remaining employee as a row (written right away, so
+            # a TXT export never holds the whole listing in memory)
+            for emp in employees:
+                write(format_employee_row(emp) + "\n")
+        else:
+            # No employees found
+            write("No employees found.\n")
+    
+    # ========== DEPARTMENT LISTING SECTION ==========
+    write(_DEPARTMENT_TITLE)
+    
+    # Check if there are departments
+    if departments:
+        # Create table header (column names and separator line)
+        write(_DEPARTMENT_TABLE_HEADER)
+        
+        format_row = _DEPARTMENT_ROW_FORMAT.format
+        
+        # Add each department as a row
+        # Rows come from get_all() (SELECT *), so every column key exists,
+        # and the only column that can be NULL (description) is handled
+        # below - no try/except is needed around each row
+        for dept in departments:
+            write(format_row(
+                dept['id'],
+                dept['name'],
+                # Get description (limit to 40 characters)
+                # [:40] slices string to first 40 characters
+                (dept['description'] or "N/A")[:40]
+            ))
+    else:
+        # No departments found
+        write("No departments found.\n")
+    
+    # ========== REPORT FOOTER ==========
+    # Add generation timestamp
+    write(_FOOTER_START)
+    write(generated_on or get_current_date())
+    write("\n" + _SEPARATOR_LINE)
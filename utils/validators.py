@@ -12,6 +12,18 @@ Think of validators as "quality checkers" that ensure data is correct before sav
 # Example: r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$' matches email addresses
 import re
 
+# Import date - used to check that a date really exists (see validate_date)
+from datetime import date
+
+
+# Regular expression patterns, compiled once when the module is imported
+# re.compile() turns a pattern string into a pattern object; using it
+# skips the lookup re.match() would do in its cache of patterns on every call
+# (the patterns are explained in the functions that use them)
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_PATTERN = re.compile(r'^[\d\s\-\(\)]+$')
+_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
 
 def validate_email(email):
     """
@@ -42,12 +54,12 @@ def validate_email(email):
     # - \. : A literal dot (escaped with \)
     # - [a-zA-Z]{2,}$ : Top-level domain (2 or more letters, like com, org, edu)
     # - ^ means "start of string", $ means "end of string"
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    # (compiled once at the top of the module as _EMAIL_PATTERN)
     
-    # re.match() checks if the email matches the pattern
+    # match() checks if the email matches the pattern
     # Returns a match object if it matches, None if it doesn't
     # bool() converts the result to True/False
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_PATTERN.match(email))
 
 
 def validate_phone(phone):
@@ -75,10 +87,10 @@ def validate_phone(phone):
     
     # Pattern allows digits, spaces, dashes, parentheses
     # ^[...]+$ means "string contains only these characters"
-    pattern = r'^[\d\s\-\(\)]+$'
+    # (compiled once at the top of the module as _PHONE_PATTERN)
     
     # Check if phone matches the pattern
-    if not re.match(pattern, phone):
+    if not _PHONE_PATTERN.match(phone):
         return False
     
     # Count actual digits (remove spaces, dashes, parentheses)
@@ -190,25 +202,27 @@ def validate_date(date_str):
     # Pattern for YYYY-MM-DD format
     # \d{4} means exactly 4 digits (year)
     # \d{2} means exactly 2 digits (month and day)
-    pattern = r'^\d{4}-\d{2}-\d{2}$'
+    # (compiled once at the top of the module as _DATE_PATTERN)
     
     # Check if date matches the pattern
-    if not re.match(pattern, date_str):
+    # fullmatch() must match the whole string - "$" alone would also accept
+    # a date followed by "\n", which the slicing below would then ignore
+    if not _DATE_PATTERN.fullmatch(date_str):
         return False, "Date must be in YYYY-MM-DD format"
     
-    # Try to parse the date to check if it's valid
+    # Try to build the date to check if it's valid
     # (e.g., check if February 30th is rejected)
     try:
-        # Import datetime here (not at top) to avoid circular imports if needed
-        from datetime import datetime
-        
-        # strptime() parses a string into a datetime object
-        # '%Y-%m-%d' is the format: Year-Month-Day
-        # If date is invalid (like Feb 30), this will raise ValueError
-        datetime.strptime(date_str, '%Y-%m-%d')
+        # The pattern above guarantees the positions of the parts:
+        # date_str[0:4] is the year, [5:7] the month, [8:10] the day
+        # int() converts them to numbers
+        # date() raises ValueError if the day doesn't exist (like Feb 30)
+        # This is much faster than datetime.strptime(), which has to read
+        # the format string '%Y-%m-%d' again on every call
+        date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
         
         # Date is valid
         return True, None
     except ValueError:
-        # If strptime() fails, date is invalid (e.g., Feb 30, Apr 31)
+        # If date() fails, date is invalid (e.g., Feb 30, Apr 31, month 13)
         return False, "Invalid date"